@@ -77,7 +77,9 @@ class GameState:
         snake2 (Snake): Second snake (Cyan)
         ai1_controller (AIController): AI controller for snake1
         ai2_controller (AIController): AI controller for snake2
-        food (Tuple[int, int]): Current food position
+        food (Tuple[int, int]): Current food position, validated by set_food()
+        occupancy (Dict[Tuple[int, int], Snake]): Body cells behind each head,
+            mapped to the snake that owns them
         game_over (bool): Whether the game has ended
         winner (Optional[Snake]): The winning snake (None for tie)
         statistics (GameStatistics): Game performance and event statistics
@@ -126,7 +128,9 @@ class GameState:
         self.snake2: Optional[Snake] = None
         self.ai1_controller: Optional[AIController] = None
         self.ai2_controller: Optional[AIController] = None
-        self.food: Optional[Tuple[int, int]] = None
+        self._food: Optional[Tuple[int, int]] = None
+        self.occupancy: Dict[Tuple[int, int], Snake] = {}
+        self._occupancy_counts: Dict[Tuple[int, int], int] = {}
         self.game_over: bool = False
         self.winner: Optional[Snake] = None
         
@@ -149,6 +153,7 @@ class GameState:
         try:
             # Create snakes with safe starting positions
             self._initialize_snakes()
+            self._rebuild_occupancy()
             
             # Create AI controllers
             self._initialize_ai_controllers()
@@ -197,6 +202,17 @@ class GameState:
         
         logger.debug(f"Snakes initialized at ({snake1_x}, {snake1_y}) and ({snake2_x}, {snake2_y})")
     
+    def _rebuild_occupancy(self) -> None:
+        """Rebuild the cell -> snake map from both snakes' bodies"""
+        occupancy = {}
+        counts: Dict[Tuple[int, int], int] = {}
+        for snake in (self.snake1, self.snake2):
+            for segment in snake.body[1:]:
+                occupancy[segment] = snake
+                counts[segment] = counts.get(segment, 0) + 1
+        self.occupancy = occupancy
+        self._occupancy_counts = counts
+    
     def _initialize_ai_controllers(self) -> None:
         """Initialize AI controllers for both snakes"""
         try:
@@ -214,6 +230,41 @@ class GameState:
             logger.error(f"Failed to initialize AI controllers: {e}")
             raise GameStateError(f"AI initialization failed: {e}")
     
+    @property
+    def food(self) -> Optional[Tuple[int, int]]:
+        """Current food position as an in-bounds (x, y) tuple of ints"""
+        return self._food
+    
+    @food.setter
+    def food(self, position: Optional[Tuple[int, int]]) -> None:
+        self.set_food(position)
+    
+    def set_food(self, position: Optional[Tuple[int, int]]) -> None:
+        """
+        Place the food, checking the position once so readers need not.
+        
+        Args:
+            position: (x, y) grid position of the food, or None for no food
+            
+        Raises:
+            GameStateError: If position is not two integers inside the grid
+        """
+        if position is None:
+            self._food = None
+            return
+        
+        if not isinstance(position, (tuple, list)) or len(position) != 2:
+            raise GameStateError(f"Invalid food position: {position!r}")
+        
+        x, y = position
+        if not isinstance(x, int) or not isinstance(y, int):
+            raise GameStateError(f"Food coordinates must be integers: {position!r}")
+        
+        if not (0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT):
+            raise GameStateError(f"Food position out of bounds: ({x}, {y})")
+        
+        self._food = (x, y)
+    
     def generate_food(self) -> Tuple[int, int]:
         """
         Generate food at a random unoccupied position.
@@ -400,14 +451,45 @@ class GameState:
         # Move snakes
         if self.snake1.alive:
             will_eat = (food_eaten_by == self.snake1)
-            self.snake1.move(grow=will_eat)
+            self._advance_snake(self.snake1, will_eat)
         
         if self.snake2.alive:
             will_eat = (food_eaten_by == self.snake2)
-            self.snake2.move(grow=will_eat)
+            self._advance_snake(self.snake2, will_eat)
         
         return food_eaten_by
     
+    def _advance_snake(self, snake: Snake, grow: bool) -> None:
+        """
+        Move a snake and apply the change to the occupancy map.
+        
+        Only the cells that actually change are touched: the previous head
+        becomes a body cell and, unless the snake grew, the old tail is freed.
+        Segments are counted per cell, so a tail cell that another segment
+        still covers (after a short snake reverses onto itself) stays occupied.
+        
+        Args:
+            snake: The snake to move
+            grow: Whether the snake eats this tick
+        """
+        previous_head = snake.get_head()
+        tail = snake.get_tail()
+        
+        snake.move(grow=grow)
+        
+        counts = self._occupancy_counts
+        self.occupancy[previous_head] = snake
+        counts[previous_head] = counts.get(previous_head, 0) + 1
+        
+        if not grow and tail in counts:
+            remaining = counts[tail] - 1
+            if remaining:
+                counts[tail] = remaining
+            else:
+                del counts[tail]
+                if self.occupancy.get(tail) is snake:
+                    del self.occupancy[tail]
+    
     def _check_collisions(self) -> None:
         """Check all collision types and update snake states"""
         # Wall collisions
@@ -441,11 +523,11 @@ class GameState:
                 logger.info("Head-to-head collision occurred")
             else:
                 # Check body collisions
-                if self.snake1.check_collision_with_snake(self.snake2):
+                if self.snake1.check_collision_with_occupancy(self.occupancy):
                     self.snake1.alive = False
                     logger.info(f"{self.snake1.name} hit {self.snake2.name}")
                 
-                if self.snake2.check_collision_with_snake(self.snake1):
+                if self.snake2.check_collision_with_occupancy(self.occupancy):
                     self.snake2.alive = False
                     logger.info(f"{self.snake2.name} hit {self.snake1.name}")
     
@@ -203,6 +203,10 @@ class SnakeGame:
                     # Log any other key presses for debugging
                     else:
                         logger.debug(f"Unhandled key press: {pygame.key.name(event.key)}")
+                
+                # Window contents were lost; repaint everything next frame
+                elif event.type == pygame.WINDOWEXPOSED:
+                    self.renderer.invalidate()
             
             return True
             
@@ -232,6 +236,9 @@ class SnakeGame:
             menu = AISelectionMenu(self.screen)
             ai_selection = menu.run()
             
+            # The menu drew over the game, so the next frame must be full
+            self.renderer.invalidate()
+            
             if ai_selection:
                 ai1_type, ai2_type = ai_selection
                 logger.info(f"Restart with new AI selection: {ai1_type} vs {ai2_type}")
@@ -388,6 +395,10 @@ class SnakeGame:
             self.screen.blit(text, text_rect)
             pygame.display.flip()
             
+            # The overlay covers the game, so the next frame must be full
+            if getattr(self, 'renderer', None) is not None:
+                self.renderer.invalidate()
+            
             # Show for 2 seconds
             pygame.time.wait(2000)
             
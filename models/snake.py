@@ -15,16 +15,37 @@ Version: 1.0.0
 """
 
 import logging
-from typing import Tuple, List, Optional, Union
+from typing import Tuple, List, Optional, Union, Dict
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 from enums import Direction
 from config import GRID_WIDTH, GRID_HEIGHT
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# A snake can never be longer than the grid has cells
+_BODY_CAPACITY = GRID_WIDTH * GRID_HEIGHT
+
+# Segment buffer is twice the capacity so the live window can slide towards
+# the front for at least a full capacity of moves before it is shifted back
+_BUFFER_SIZE = 2 * _BODY_CAPACITY
+
+# Last valid cell on each axis
+_MAX_X = GRID_WIDTH - 1
+_MAX_Y = GRID_HEIGHT - 1
+
+# Direction that would reverse the snake straight into its own neck
+_OPPOSITE = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT,
+}
+
 
 class SnakeError(Exception):
     """Base exception for snake-related errors"""
@@ -57,6 +78,12 @@ class Snake:
     The snake consists of a body (list of positions) where the first element
     is the head. The snake can move in four directions and grow when eating food.
     
+    Segments are stored as a contiguous window of two fixed-size int16
+    buffers (x and y coordinates) that slides one slot towards the front on
+    every move, so moving only writes the new head. `body_x`/`body_y` expose
+    that window as arrays; `body` is a list view of it rebuilt on first
+    access after each move.
+    
     Attributes:
         body (List[Tuple[int, int]]): List of (x, y) positions forming the snake
         direction (Direction): Current movement direction
@@ -76,6 +103,14 @@ class Snake:
     INITIAL_SCORE = 0
     INITIAL_LENGTH = 1
     
+    # Fixed attribute layout: instance fields resolve through slot
+    # descriptors instead of a per-instance __dict__
+    __slots__ = (
+        'direction', 'color', 'name', 'score', 'alive', 'stats',
+        '_initial_position', '_initial_direction',
+        '_body_x', '_body_y', '_head_index', '_length', '_head', '_body_cache',
+    )
+    
     def __init__(self, start_pos: Tuple[int, int], 
                  color: Tuple[int, int, int], 
                  name: str) -> None:
@@ -99,7 +134,9 @@ class Snake:
             self._validate_name(name)
             
             # Initialize snake attributes
-            self.body: List[Tuple[int, int]] = [start_pos]
+            self._body_x = np.empty(_BUFFER_SIZE, dtype=np.int16)
+            self._body_y = np.empty(_BUFFER_SIZE, dtype=np.int16)
+            self.body = [start_pos]
             self.direction: Direction = Direction.RIGHT
             self.color: Tuple[int, int, int] = color
             self.name: str = name
@@ -118,7 +155,7 @@ class Snake:
             raise
     
     @staticmethod
-    def _validate_position(position: Tuple[int, int]) -> None:
+    def _validate_position(position: Tuple[int, int], _mx: int = _MAX_X, _my: int = _MAX_Y) -> None:
         """
         Validate a grid position.
         
@@ -136,13 +173,14 @@ class Snake:
             raise InvalidPositionError(f"Position must have 2 elements, got {len(position)}")
         
         x, y = position
-        if not isinstance(x, int) or not isinstance(y, int):
+        if type(x) is not int or type(y) is not int:
             raise TypeError("Position coordinates must be integers")
         
-        if not (0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT):
+        # Any negative term means a coordinate is below 0 or past the last cell
+        if (x | y | (_mx - x) | (_my - y)) < 0:
             raise InvalidPositionError(
                 f"Position ({x}, {y}) out of bounds. "
-                f"Valid range: x=[0, {GRID_WIDTH-1}], y=[0, {GRID_HEIGHT-1}]"
+                f"Valid range: x=[0, {_mx}], y=[0, {_my}]"
             )
     
     @staticmethod
@@ -163,8 +201,14 @@ class Snake:
         if len(color) != 3:
             raise ValueError(f"Color must have 3 elements (RGB), got {len(color)}")
         
+        r, g, b = color
+        if type(r) is int and type(g) is int and type(b) is int:
+            if (r | g | b | (255 - r) | (255 - g) | (255 - b)) >= 0:
+                return
+        
+        # Slow path: find the offending component for the error message
         for i, value in enumerate(color):
-            if not isinstance(value, int):
+            if not isinstance(value, int) or isinstance(value, bool):
                 raise TypeError(f"Color component {i} must be an integer")
             if not (0 <= value <= 255):
                 raise ValueError(f"Color component {i} must be in range [0, 255], got {value}")
@@ -190,20 +234,67 @@ class Snake:
         if len(name) > 50:
             raise ValueError(f"Name too long (max 50 characters), got {len(name)}")
     
+    @property
+    def body(self) -> List[Tuple[int, int]]:
+        """
+        Snake segments from head to tail as (x, y) tuples.
+        
+        The list is built from the ring buffer on first access after a move
+        and shared until the next one, so treat it as read-only; assign a
+        new list to replace the body.
+        """
+        if self._body_cache is None:
+            self._body_cache = list(zip(self.body_x.tolist(), self.body_y.tolist()))
+        return self._body_cache
+    
+    @body.setter
+    def body(self, positions: List[Tuple[int, int]]) -> None:
+        if not positions:
+            raise ValueError("Snake body cannot be empty")
+        if len(positions) > _BODY_CAPACITY:
+            raise ValueError(f"Snake body cannot exceed {_BODY_CAPACITY} segments")
+        
+        # Park the body at the end of the buffer so it can slide forward for
+        # as long as possible before it has to be shifted back
+        start = _BUFFER_SIZE - len(positions)
+        xs, ys = zip(*positions)
+        self._body_x[start:] = xs
+        self._body_y[start:] = ys
+        self._head_index = start
+        self._length = len(positions)
+        self._head = tuple(positions[0])
+        self._body_cache = None
+    
+    @property
+    def body_x(self) -> np.ndarray:
+        """
+        X coordinates of the segments from head to tail.
+        
+        An int16 view into the snake's buffer, valid until the next move;
+        do not modify it.
+        """
+        start = self._head_index
+        return self._body_x[start:start + self._length]
+    
+    @property
+    def body_y(self) -> np.ndarray:
+        """
+        Y coordinates of the segments from head to tail.
+        
+        An int16 view into the snake's buffer, valid until the next move;
+        do not modify it.
+        """
+        start = self._head_index
+        return self._body_y[start:start + self._length]
+    
     def get_head(self) -> Tuple[int, int]:
         """
         Get the current position of the snake's head.
         
         Returns:
             Tuple of (x, y) coordinates of the head
-            
-        Raises:
-            RuntimeError: If snake body is empty (should never happen)
         """
-        if not self.body:
-            raise RuntimeError("Snake body is empty - this should never happen!")
-        
-        return self.body[0]
+        return self._head
     
     def set_direction(self, new_direction: Direction) -> bool:
         """
@@ -220,20 +311,17 @@ class Snake:
         Raises:
             InvalidDirectionError: If new_direction is not a Direction enum
         """
-        if not isinstance(new_direction, Direction):
+        if type(new_direction) is not Direction:
             raise InvalidDirectionError(
                 f"Direction must be a Direction enum, got {type(new_direction)}"
             )
         
         # Prevent moving backwards into self
-        if len(self.body) > 1:
-            current_dx, current_dy = self.direction.value
-            new_dx, new_dy = new_direction.value
-            
-            # Check if new direction is opposite to current
-            if (current_dx + new_dx == 0 and current_dy + new_dy == 0):
-                logger.debug(f"Prevented backward movement from {self.direction} to {new_direction}")
-                return False
+        if self._length > 1 and _OPPOSITE[new_direction] is self.direction:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Prevented backward movement from %s to %s",
+                             self.direction, new_direction)
+            return False
         
         self.direction = new_direction
         return True
@@ -249,61 +337,67 @@ class Snake:
             The new head position if move was successful, None if snake is dead
             
         Raises:
-            RuntimeError: If snake state is corrupted
+            SnakeError: If growing would exceed the grid capacity
         """
         if not self.alive:
             logger.warning(f"Attempted to move dead snake '{self.name}'")
             return None
         
-        try:
-            # Get current head position
-            head_x, head_y = self.get_head()
-            
-            # Calculate new head position
-            dx, dy = self.direction.value
-            new_head = (head_x + dx, head_y + dy)
-            
-            # Add new head
-            self.body.insert(0, new_head)
-            
-            # Remove tail if not growing
-            if not grow:
-                self.body.pop()
-            else:
-                self.stats.food_eaten += 1
-                logger.debug(f"Snake '{self.name}' grew to length {len(self.body)}")
-            
-            # Update statistics
-            self.stats.moves_made += 1
-            
-            return new_head
-            
-        except Exception as e:
-            logger.error(f"Error during snake movement: {e}")
-            raise RuntimeError(f"Failed to move snake: {e}")
+        # Refuse to grow before anything is modified, so a failed move leaves
+        # the snake untouched
+        if grow and self._length == _BODY_CAPACITY:
+            raise SnakeError("Snake already fills the whole grid")
+        
+        # Get current head position
+        head_x, head_y = self.get_head()
+        
+        # Calculate new head position
+        dx, dy = self.direction.value
+        new_head = (head_x + dx, head_y + dy)
+        
+        # Write the new head one slot before the old one; when not growing
+        # the tail slot simply falls out of the live window
+        index = self._head_index
+        if not index:
+            # Window reached the front: shift it back to the end once, which
+            # leaves room for at least another capacity of moves
+            length = self._length
+            index = _BUFFER_SIZE - length
+            self._body_x[index:] = self._body_x[:length]
+            self._body_y[index:] = self._body_y[:length]
+        index -= 1
+        self._body_x[index] = new_head[0]
+        self._body_y[index] = new_head[1]
+        self._head_index = index
+        self._head = new_head
+        self._body_cache = None
+        
+        if grow:
+            self._length += 1
+            self.stats.food_eaten += 1
+            logger.debug(f"Snake '{self.name}' grew to length {self._length}")
+        
+        # Update statistics
+        self.stats.moves_made += 1
+        
+        return new_head
     
-    def check_wall_collision(self) -> bool:
+    def check_wall_collision(self, _mx: int = _MAX_X, _my: int = _MAX_Y) -> bool:
         """
         Check if the snake's head has collided with a wall.
         
         Returns:
             bool: True if collision detected, False otherwise
         """
-        try:
-            head_x, head_y = self.get_head()
-            collision = (head_x < 0 or head_x >= GRID_WIDTH or 
-                        head_y < 0 or head_y >= GRID_HEIGHT)
-            
-            if collision:
-                self.stats.collisions += 1
-                logger.info(f"Snake '{self.name}' hit wall at ({head_x}, {head_y})")
-            
-            return collision
-            
-        except Exception as e:
-            logger.error(f"Error checking wall collision: {e}")
-            # In case of error, consider it a collision for safety
-            return True
+        head_x, head_y = self._head
+        # Grid bounds are bound as defaults so they load as locals
+        collision = (head_x | head_y | (_mx - head_x) | (_my - head_y)) < 0
+        
+        if collision:
+            self.stats.collisions += 1
+            logger.info(f"Snake '{self.name}' hit wall at ({head_x}, {head_y})")
+        
+        return collision
     
     def check_self_collision(self) -> bool:
         """
@@ -312,24 +406,20 @@ class Snake:
         Returns:
             bool: True if self-collision detected, False otherwise
         """
-        try:
-            if len(self.body) < 4:  # Snake too short to collide with itself
-                return False
-            
-            head = self.get_head()
-            # Check if head position exists in the rest of the body
-            collision = head in self.body[1:]
-            
-            if collision:
-                self.stats.collisions += 1
-                logger.info(f"Snake '{self.name}' collided with itself at {head}")
-            
-            return collision
-            
-        except Exception as e:
-            logger.error(f"Error checking self collision: {e}")
-            # In case of error, consider it a collision for safety
-            return True
+        if self._length < 4:  # Snake too short to collide with itself
+            return False
+        
+        head = self.get_head()
+        head_x, head_y = head
+        # Every step flips the parity of x + y, so the head can only ever
+        # land on an even-indexed segment (index 2 being a reversal)
+        collision = bool(((self.body_x[2::2] == head_x) & (self.body_y[2::2] == head_y)).any())
+        
+        if collision:
+            self.stats.collisions += 1
+            logger.info(f"Snake '{self.name}' collided with itself at {head}")
+        
+        return collision
     
     def check_collision_with_snake(self, other_snake: 'Snake') -> bool:
         """
@@ -347,26 +437,46 @@ class Snake:
         if not isinstance(other_snake, Snake):
             raise TypeError(f"Expected Snake instance, got {type(other_snake)}")
         
-        try:
-            # Dead snakes don't collide
-            if not self.alive or not other_snake.alive:
-                return False
-            
-            head = self.get_head()
-            collision = head in other_snake.body
-            
-            if collision:
-                self.stats.collisions += 1
-                logger.info(
-                    f"Snake '{self.name}' collided with '{other_snake.name}' at {head}"
-                )
-            
-            return collision
+        # Dead snakes don't collide
+        if not self.alive or not other_snake.alive:
+            return False
+        
+        head = self.get_head()
+        collision = head in other_snake.body
+        
+        if collision:
+            self.stats.collisions += 1
+            logger.info(
+                f"Snake '{self.name}' collided with '{other_snake.name}' at {head}"
+            )
+        
+        return collision
+    
+    def check_collision_with_occupancy(self, occupancy: Dict[Tuple[int, int], 'Snake']) -> bool:
+        """
+        Check if this snake's head has collided with another snake's body.
+        
+        Equivalent to calling check_collision_with_snake for every opponent,
+        but resolved with a single lookup in a shared cell -> snake map.
+        
+        Args:
+            occupancy: Map of every body cell behind a head to its owning snake
             
-        except Exception as e:
-            logger.error(f"Error checking collision with other snake: {e}")
-            # In case of error, consider it a collision for safety
-            return True
+        Returns:
+            bool: True if collision detected, False otherwise
+        """
+        if not self.alive:
+            return False
+        
+        head = self.get_head()
+        owner = occupancy.get(head)
+        collision = owner is not None and owner is not self and owner.alive
+        
+        if collision:
+            self.stats.collisions += 1
+            logger.info(f"Snake '{self.name}' collided with '{owner.name}' at {head}")
+        
+        return collision
     
     def get_length(self) -> int:
         """
@@ -375,7 +485,7 @@ class Snake:
         Returns:
             int: Number of body segments
         """
-        return len(self.body)
+        return self._length
     
     def get_tail(self) -> Optional[Tuple[int, int]]:
         """
@@ -384,9 +494,10 @@ class Snake:
         Returns:
             Tuple of (x, y) coordinates of the tail, or None if body is empty
         """
-        if not self.body:
+        if not self._length:
             return None
-        return self.body[-1]
+        index = self._head_index + self._length - 1
+        return (int(self._body_x[index]), int(self._body_y[index]))
     
     def reset(self) -> None:
         """
@@ -394,26 +505,21 @@ class Snake:
         
         Useful for restarting the game without creating new instances.
         """
-        try:
-            self.body = [self._initial_position]
-            self.direction = self._initial_direction
-            self.score = self.INITIAL_SCORE
-            self.alive = True
-            self.stats = SnakeStats()
-            
-            logger.info(f"Snake '{self.name}' reset to initial state")
-            
-        except Exception as e:
-            logger.error(f"Error resetting snake: {e}")
-            raise RuntimeError(f"Failed to reset snake: {e}")
+        self.body = [self._initial_position]
+        self.direction = self._initial_direction
+        self.score = self.INITIAL_SCORE
+        self.alive = True
+        self.stats = SnakeStats()
+        
+        logger.info(f"Snake '{self.name}' reset to initial state")
     
     def __str__(self) -> str:
         """String representation of the snake."""
         return (f"Snake(name='{self.name}', alive={self.alive}, "
-                f"length={len(self.body)}, score={self.score})")
+                f"length={self._length}, score={self.score})")
     
     def __repr__(self) -> str:
         """Detailed representation of the snake."""
         return (f"Snake(name='{self.name}', start_pos={self._initial_position}, "
-                f"color={self.color}, alive={self.alive}, length={len(self.body)}, "
+                f"color={self.color}, alive={self.alive}, length={self._length}, "
                 f"score={self.score}, direction={self.direction})")
\ No newline at end of file
@@ -14,9 +14,10 @@ Version: 1.0.0
 
 import pygame
 import logging
+import functools
 from typing import Optional, Tuple, Dict, List
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 
 from config import *
 
@@ -29,8 +30,33 @@ class MenuError(Exception):
     pass
 
 
-class MenuState(Enum):
-    """Enumeration of menu states"""
+@functools.lru_cache(maxsize=32)
+def _get_font(name: Optional[str], size: int) -> pygame.font.Font:
+    """
+    Get a font, loading it only the first time each (name, size) is requested.
+    
+    Fonts are shared by every menu instance, so reopening the menu between
+    games does not reopen the font files.
+    
+    Args:
+        name: System font name, or None for pygame's default font
+        size: Font size in points
+        
+    Returns:
+        The loaded font
+    """
+    if name is None:
+        return pygame.font.Font(None, size)
+    return pygame.font.SysFont(name, size)
+
+
+class MenuState(IntEnum):
+    """
+    Enumeration of menu states.
+    
+    Values are ordered so that every state up to SELECTING_SNAKE2 is a
+    selection state; comparisons run on plain ints.
+    """
     SELECTING_SNAKE1 = 1
     SELECTING_SNAKE2 = 2
     COMPLETE = 3
@@ -58,6 +84,7 @@ class MenuConfig:
     selection_box_width: int = 500
     selection_box_height: int = 80
     selection_box_thickness: int = 3
+    pulse_frames: int = 60  # frames per selection box pulse cycle
     
     # Timing
     fps: int = 30
@@ -75,13 +102,29 @@ class AISelectionMenu:
     
     Attributes:
         screen: Pygame screen surface
-        clock: Pygame clock for FPS control
         ai_options: List of available AI strategies
         ai_descriptions: Descriptions for each AI strategy
         state: Current menu state
+        selections: Chosen ai_options index for snake 1 and snake 2
         config: Menu configuration settings
     """
     
+    # Window events after which the screen may no longer show the menu
+    REDRAW_EVENTS = (
+        pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN, pygame.WINDOWRESTORED,
+        pygame.WINDOWFOCUSGAINED, pygame.WINDOWSIZECHANGED
+    )
+    
+    # Only these event types reach the menu's queue while it is open
+    HANDLED_EVENTS = (pygame.QUIT, pygame.KEYDOWN) + REDRAW_EVENTS
+    
+    # Control hints shown at the bottom of the menu
+    INSTRUCTIONS = (
+        "↑↓ Arrow Keys: Select AI",
+        "ENTER: Confirm Selection",
+        "ESC: Quit"
+    )
+    
     def __init__(self, screen: pygame.Surface, config: Optional[MenuConfig] = None) -> None:
         """
         Initialize the AI selection menu.
@@ -104,13 +147,17 @@ class AISelectionMenu:
         self.screen = screen
         self.screen_width, self.screen_height = screen.get_size()
         
+        # Fixed anchor points used by every draw helper
+        self._cx = self.screen_width // 2
+        self._cy = self.screen_height // 2
+        
         # Use provided config or defaults
         self.config = config or MenuConfig()
+        self._instructions_y_start = self.screen_height - self.config.instructions_bottom_margin
+        self._prev_sel_y = self.screen_height - 20
         
         # Initialize pygame components
         try:
-            self.clock = pygame.time.Clock()
-            
             # Initialize fonts with error handling
             self._init_fonts()
             
@@ -131,197 +178,347 @@ class AISelectionMenu:
             if option not in self.ai_descriptions:
                 raise MenuError(f"Missing description for AI option: {option}")
         
+        # Rendered text keyed by (text, color, font id, center); every string
+        # the menu can show is fixed, so all of it is rendered once up front
+        self._static_surfaces: Dict[Tuple, Tuple[pygame.Surface, pygame.Rect]] = {}
+        self._prerender_static_text()
+        self._layout_options()
+        
+        # Everything except the selection box is composed here and only
+        # redrawn when the state changes
+        self._background = pygame.Surface((self.screen_width, self.screen_height)).convert(self.screen)
+        self._drawn_state: Optional[MenuState] = None
+        self._prev_box_rect: Optional[pygame.Rect] = None
+        
+        # Screen areas changed since the last display update
+        self._dirty_rects: List[pygame.Rect] = []
+        
+        # Selection box colors for every frame of the pulse, per snake color
+        self._pulse_colors = {
+            color: self._build_pulse_colors(color) for color in (ORANGE, CYAN)
+        }
+        
         # Menu state
-        self.snake1_selection = 0  # Index in ai_options
-        self.snake2_selection = 0
+        self.selections = [0, 0]  # Index in ai_options, per snake
+        
+        # Wrap-around neighbours of each option index for up/down navigation
+        option_count = len(self.ai_options)
+        self._prev_idx = [(i - 1) % option_count for i in range(option_count)]
+        self._next_idx = [(i + 1) % option_count for i in range(option_count)]
+        
+        # Key code -> handler; each returns True to continue, False to exit
+        self._key_handlers = {
+            pygame.K_UP: self._on_up,
+            pygame.K_DOWN: self._on_down,
+            pygame.K_RETURN: self._on_enter,
+            pygame.K_ESCAPE: self._on_escape,
+        }
         self.state = MenuState.SELECTING_SNAKE1
         
-        # Performance tracking
+        # Advances only while the pulsing selection box is drawn
         self.frame_count = 0
-        self.last_key_time = 0
         
-        # Enable key repeat for smoother navigation
-        pygame.key.set_repeat(self.config.key_repeat_delay, self.config.key_repeat_interval)
+        self._install_input()
         
         logger.info("AI Selection Menu initialized successfully")
     
+    def _build_pulse_colors(self, color: Tuple[int, int, int]) -> List[Tuple[int, int, int]]:
+        """
+        Precompute the selection box color for each frame of one pulse.
+        
+        The box brightness ramps linearly between half and full intensity,
+        which on the black background matches fading its alpha from 128 to 255.
+        
+        Args:
+            color: Full-intensity RGB color of the box
+            
+        Returns:
+            List of RGB colors indexed by frame within the pulse
+        """
+        period = self.config.pulse_frames
+        half = max(period // 2, 1)
+        colors = []
+        for frame in range(period):
+            alpha = 128 + 127 * abs(frame - half) // half
+            colors.append(tuple(c * alpha // 255 for c in color))
+        return colors
+    
+    @property
+    def snake1_selection(self) -> int:
+        """Index in ai_options chosen for snake 1"""
+        return self.selections[0]
+    
+    @snake1_selection.setter
+    def snake1_selection(self, index: int) -> None:
+        self.selections[0] = index
+    
+    @property
+    def snake2_selection(self) -> int:
+        """Index in ai_options chosen for snake 2"""
+        return self.selections[1]
+    
+    @snake2_selection.setter
+    def snake2_selection(self, index: int) -> None:
+        self.selections[1] = index
+    
     def _init_fonts(self) -> None:
         """Initialize fonts with fallback handling"""
         try:
             # Try to use default font
-            self.title_font = pygame.font.Font(None, self.config.title_font_size)
-            self.font = pygame.font.Font(None, self.config.main_font_size)
-            self.small_font = pygame.font.Font(None, self.config.small_font_size)
+            self.title_font = _get_font(None, self.config.title_font_size)
+            self.font = _get_font(None, self.config.main_font_size)
+            self.small_font = _get_font(None, self.config.small_font_size)
             
         except Exception as e:
             logger.warning(f"Failed to load default font: {e}")
             
             # Fallback to system font
             try:
-                self.title_font = pygame.font.SysFont('arial', self.config.title_font_size)
-                self.font = pygame.font.SysFont('arial', self.config.main_font_size)
-                self.small_font = pygame.font.SysFont('arial', self.config.small_font_size)
+                self.title_font = _get_font('arial', self.config.title_font_size)
+                self.font = _get_font('arial', self.config.main_font_size)
+                self.small_font = _get_font('arial', self.config.small_font_size)
                 
             except Exception as e2:
                 logger.error(f"Failed to load fallback font: {e2}")
                 raise MenuError("Could not initialize any fonts")
     
+    def _text(self, font: pygame.font.Font, text: str,
+              color: Tuple[int, int, int],
+              center: Tuple[int, int]) -> Tuple[pygame.Surface, pygame.Rect]:
+        """
+        Get a rendered text surface and its rect, rendering only on first use.
+        
+        Args:
+            font: Font to render with
+            text: String to render
+            color: RGB text color
+            center: Center point of the text on screen
+            
+        Returns:
+            Tuple of (surface, rect) ready to blit
+        """
+        key = (text, color, id(font), center)
+        cached = self._static_surfaces.get(key)
+        if cached is None:
+            # All menu text sits on the black background, so render it
+            # pre-composited and opaque in the screen's pixel format; blits
+            # are then plain copies with no alpha blending or conversion
+            surface = font.render(text, True, color, BLACK).convert(self.screen)
+            cached = (surface, surface.get_rect(center=center))
+            self._static_surfaces[key] = cached
+        return cached
+    
+    def _prerender_static_text(self) -> None:
+        """Render every fixed menu string once so draw() only blits"""
+        center_x = self._cx
+        
+        self._text(self.title_font, "AI SNAKE BATTLE", YELLOW, (center_x, self.config.title_y))
+        self._text(self.font, "Select AI Behavior", WHITE, (center_x, self.config.subtitle_y))
+        
+        indicator_y = self.config.snake_indicator_y
+        self._text(self.font, "Selecting for ORANGE SNAKE", ORANGE, (center_x, indicator_y))
+        self._text(self.font, "Selecting for CYAN SNAKE", CYAN, (center_x, indicator_y))
+        
+        for option in self.ai_options:
+            self._text(self.small_font, f"Orange: {option}", ORANGE,
+                       (center_x, self._prev_sel_y))
+        
+        y = self._instructions_y_start
+        for instruction in self.INSTRUCTIONS:
+            self._text(self.small_font, instruction, WHITE, (center_x, y))
+            y += 30
+    
+    def _layout_options(self) -> None:
+        """Precompute the surfaces and rects of every option row and its selection box"""
+        center_x = self._cx
+        box_x = center_x - self.config.selection_box_width // 2
+        
+        # (option surface, option rect, description surface, description rect)
+        self._option_layout: List[Tuple[pygame.Surface, pygame.Rect,
+                                        pygame.Surface, pygame.Rect]] = []
+        self._box_rects: List[pygame.Rect] = []
+        
+        for i, option in enumerate(self.ai_options):
+            y = self.config.options_start_y + i * self.config.option_spacing
+            
+            option_surface, option_rect = self._text(self.font, option, WHITE, (center_x, y))
+            desc_surface, desc_rect = self._text(
+                self.small_font, self.ai_descriptions[option], GRAY, (center_x, y + 25)
+            )
+            self._option_layout.append((option_surface, option_rect, desc_surface, desc_rect))
+            
+            self._box_rects.append(pygame.Rect(
+                box_x,
+                y - self.config.selection_box_padding,
+                self.config.selection_box_width,
+                self.config.selection_box_height
+            ))
+    
     def draw(self) -> None:
         """
         Draw the menu interface.
         
         This method renders all menu elements including title, options,
-        descriptions, and instructions.
+        descriptions, and instructions. The full screen is only recomposed
+        and flipped when the state changes; other frames just move or
+        redraw the selection box and update the rects it touched.
         """
         try:
-            # Clear screen
-            self.screen.fill(BLACK)
-            
-            # Draw title
-            self._draw_title()
-            
-            # Draw current selection state
-            self._draw_selection_state()
-            
-            # Draw AI options
-            self._draw_ai_options()
-            
-            # Draw instructions
-            self._draw_instructions()
-            
-            # Draw previous selection if on snake 2
-            if self.state == MenuState.SELECTING_SNAKE2:
-                self._draw_previous_selection()
-            
-            # Update display
-            pygame.display.flip()
-            
-            # Track frame count for animations
-            self.frame_count += 1
+            if self.state != self._drawn_state:
+                self._draw_full()
+                self._drawn_state = self.state
+            else:
+                self._draw_frame()
             
         except Exception as e:
             logger.error(f"Error drawing menu: {e}")
+            # Force a full redraw once drawing works again
+            self._drawn_state = None
+            self._dirty_rects.clear()
             # Try to at least show error message
             self._draw_error_screen(str(e))
     
+    def _draw_full(self) -> None:
+        """Compose the static background, then show it with the selection box"""
+        # Clear background
+        self._background.fill(BLACK)
+        
+        # Draw title
+        self._draw_title()
+        
+        # Draw current selection state
+        self._draw_selection_state()
+        
+        # Draw AI options
+        self._draw_ai_options()
+        
+        # Draw instructions
+        self._draw_instructions()
+        
+        # Draw previous selection if on snake 2
+        if self.state == MenuState.SELECTING_SNAKE2:
+            self._draw_previous_selection()
+        
+        self.screen.blit(self._background, (0, 0))
+        self._prev_box_rect = self._draw_selection_box()
+        
+        # Update display; everything changed, so push the whole screen
+        pygame.display.flip()
+        self._dirty_rects.clear()
+    
+    def invalidate(self) -> None:
+        """
+        Force the next frame to be drawn and flipped in full.
+        
+        Partial frames only update the selection box, so call this whenever
+        the window contents may have been lost or drawn over.
+        """
+        self._drawn_state = None
+    
+    def _draw_frame(self) -> None:
+        """Redraw only the selection box and push just the dirty rects to the display"""
+        dirty_rects = self._dirty_rects
+        
+        prev_rect = self._prev_box_rect
+        if prev_rect is not None:
+            # Restore what was under the previous box
+            self.screen.blit(self._background, prev_rect, prev_rect)
+            dirty_rects.append(prev_rect)
+        
+        box_rect = self._draw_selection_box()
+        self._prev_box_rect = box_rect
+        if box_rect is not None and box_rect is not prev_rect:
+            dirty_rects.append(box_rect)
+        
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+            dirty_rects.clear()
+    
+    def _draw_selection_box(self) -> Optional[pygame.Rect]:
+        """
+        Draw the animated box around the current option onto the screen.
+        
+        Returns:
+            The rect covered by the box, or None when nothing is being selected
+        """
+        if self.state > MenuState.SELECTING_SNAKE2:
+            return None
+        
+        current_selection = self.selections[self.state.value - 1]
+        snake_color = ORANGE if self.state == MenuState.SELECTING_SNAKE1 else CYAN
+        
+        # Animated selection box
+        pulse = self._pulse_colors[snake_color]
+        frame = self.frame_count
+        box_color = pulse[frame % len(pulse)]
+        
+        # Only frames that show the pulsing box advance the animation
+        self.frame_count = frame + 1
+        box_rect = self._box_rects[current_selection]
+        
+        pygame.draw.rect(self.screen, box_color, box_rect, self.config.selection_box_thickness)
+        return box_rect
+    
     def _draw_title(self) -> None:
         """Draw the main title"""
-        try:
-            title = self.title_font.render("AI SNAKE BATTLE", True, YELLOW)
-            title_rect = title.get_rect(center=(self.screen_width // 2, self.config.title_y))
-            self.screen.blit(title, title_rect)
-            
-            subtitle = self.font.render("Select AI Behavior", True, WHITE)
-            subtitle_rect = subtitle.get_rect(center=(self.screen_width // 2, self.config.subtitle_y))
-            self.screen.blit(subtitle, subtitle_rect)
-            
-        except Exception as e:
-            logger.error(f"Error drawing title: {e}")
+        center_x = self._cx
+        self._background.blit(*self._text(self.title_font, "AI SNAKE BATTLE", YELLOW,
+                                          (center_x, self.config.title_y)))
+        self._background.blit(*self._text(self.font, "Select AI Behavior", WHITE,
+                                          (center_x, self.config.subtitle_y)))
     
     def _draw_selection_state(self) -> None:
         """Draw current selection state indicator"""
-        if self.state not in [MenuState.SELECTING_SNAKE1, MenuState.SELECTING_SNAKE2]:
+        if self.state > MenuState.SELECTING_SNAKE2:
             return
         
-        try:
-            # Determine snake info based on current state
-            if self.state == MenuState.SELECTING_SNAKE1:
-                snake_color = ORANGE
-                snake_name = "ORANGE SNAKE"
-                current_selection = self.snake1_selection
-            else:
-                snake_color = CYAN
-                snake_name = "CYAN SNAKE"
-                current_selection = self.snake2_selection
-            
-            # Draw snake selection text
-            snake_text = self.font.render(f"Selecting for {snake_name}", True, snake_color)
-            snake_rect = snake_text.get_rect(center=(self.screen_width // 2, self.config.snake_indicator_y))
-            self.screen.blit(snake_text, snake_rect)
-            
-        except Exception as e:
-            logger.error(f"Error drawing selection state: {e}")
+        # Determine snake info based on current state
+        if self.state == MenuState.SELECTING_SNAKE1:
+            snake_color = ORANGE
+            snake_name = "ORANGE SNAKE"
+        else:
+            snake_color = CYAN
+            snake_name = "CYAN SNAKE"
+        
+        # Draw snake selection text
+        self._background.blit(*self._text(
+            self.font, f"Selecting for {snake_name}", snake_color,
+            (self._cx, self.config.snake_indicator_y)
+        ))
     
     def _draw_ai_options(self) -> None:
         """Draw AI strategy options with descriptions"""
-        try:
-            current_selection = (self.snake1_selection if self.state == MenuState.SELECTING_SNAKE1 
-                               else self.snake2_selection)
-            snake_color = ORANGE if self.state == MenuState.SELECTING_SNAKE1 else CYAN
+        background = self._background
+        for option_surface, option_rect, desc_surface, desc_rect in self._option_layout:
+            # Draw option text
+            background.blit(option_surface, option_rect)
             
-            for i, option in enumerate(self.ai_options):
-                y = self.config.options_start_y + i * self.config.option_spacing
-                
-                # Draw selection box for current selection
-                if i == current_selection and self.state in [MenuState.SELECTING_SNAKE1, MenuState.SELECTING_SNAKE2]:
-                    # Animated selection box
-                    box_alpha = int(128 + 127 * abs((self.frame_count % 60) - 30) / 30)
-                    box_color = (*snake_color, box_alpha) if len(snake_color) == 3 else snake_color
-                    
-                    box_rect = pygame.Rect(
-                        self.screen_width // 2 - self.config.selection_box_width // 2,
-                        y - self.config.selection_box_padding,
-                        self.config.selection_box_width,
-                        self.config.selection_box_height
-                    )
-                    
-                    pygame.draw.rect(self.screen, snake_color[:3], box_rect, self.config.selection_box_thickness)
-                
-                # Draw option text
-                option_text = self.font.render(option, True, WHITE)
-                option_rect = option_text.get_rect(center=(self.screen_width // 2, y))
-                self.screen.blit(option_text, option_rect)
-                
-                # Draw description
-                desc_text = self.small_font.render(self.ai_descriptions[option], True, GRAY)
-                desc_rect = desc_text.get_rect(center=(self.screen_width // 2, y + 25))
-                self.screen.blit(desc_text, desc_rect)
-                
-        except Exception as e:
-            logger.error(f"Error drawing AI options: {e}")
+            # Draw description
+            background.blit(desc_surface, desc_rect)
     
     def _draw_instructions(self) -> None:
         """Draw control instructions"""
-        try:
-            instructions = [
-                "↑↓ Arrow Keys: Select AI",
-                "ENTER: Confirm Selection",
-                "ESC: Quit"
-            ]
-            
-            y = self.screen_height - self.config.instructions_bottom_margin
-            
-            for instruction in instructions:
-                inst_text = self.small_font.render(instruction, True, WHITE)
-                inst_rect = inst_text.get_rect(center=(self.screen_width // 2, y))
-                self.screen.blit(inst_text, inst_rect)
-                y += 30
-                
-        except Exception as e:
-            logger.error(f"Error drawing instructions: {e}")
+        y = self._instructions_y_start
+        
+        for instruction in self.INSTRUCTIONS:
+            self._background.blit(*self._text(self.small_font, instruction, WHITE,
+                                              (self._cx, y)))
+            y += 30
     
     def _draw_previous_selection(self) -> None:
         """Draw the first snake's selection when selecting second snake"""
-        try:
-            selection_text = self.small_font.render(
-                f"Orange: {self.ai_options[self.snake1_selection]}", 
-                True, ORANGE
-            )
-            selection_rect = selection_text.get_rect(
-                center=(self.screen_width // 2, self.screen_height - 20)
-            )
-            self.screen.blit(selection_text, selection_rect)
-            
-        except Exception as e:
-            logger.error(f"Error drawing previous selection: {e}")
+        self._background.blit(*self._text(
+            self.small_font, f"Orange: {self.ai_options[self.snake1_selection]}", ORANGE,
+            (self._cx, self._prev_sel_y)
+        ))
     
     def _draw_error_screen(self, error_message: str) -> None:
         """Draw error screen as fallback"""
         try:
             self.screen.fill(BLACK)
-            error_font = pygame.font.Font(None, 24)
+            error_font = _get_font(None, 24)
             error_text = error_font.render(f"Menu Error: {error_message}", True, RED)
-            error_rect = error_text.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
+            error_rect = error_text.get_rect(center=(self._cx, self._cy))
             self.screen.blit(error_text, error_rect)
             pygame.display.flip()
         except:
@@ -332,17 +529,20 @@ class AISelectionMenu:
         """
         Handle input events for menu navigation.
         
+        All pending events are drained in one call; key presses are applied
+        in order until one of them completes or cancels the menu.
+        
         Returns:
             bool: True to continue, False to exit
         """
         try:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.state = MenuState.CANCELLED
+            for event in pygame.event.get(self.HANDLED_EVENTS):
+                if not self._dispatch_event(event):
                     return False
                 
-                elif event.type == pygame.KEYDOWN:
-                    return self._handle_keydown(event)
+                # Leave keys pressed after the final confirmation unhandled
+                if self.state == MenuState.COMPLETE:
+                    break
             
             return True
             
@@ -350,65 +550,77 @@ class AISelectionMenu:
             logger.error(f"Error handling events: {e}")
             return True  # Continue despite error
     
-    def _handle_keydown(self, event: pygame.event.Event) -> bool:
+    def _dispatch_event(self, event: pygame.event.Event) -> bool:
         """
-        Handle keyboard input.
+        Apply a single QUIT, KEYDOWN or REDRAW_EVENTS event.
         
         Args:
-            event: Pygame keyboard event
+            event: Pygame event of one of HANDLED_EVENTS
             
         Returns:
             bool: True to continue, False to exit
         """
-        current_time = pygame.time.get_ticks()
-        
-        # Handle escape key
-        if event.key == pygame.K_ESCAPE:
+        if event.type == pygame.QUIT:
             self.state = MenuState.CANCELLED
-            logger.info("Menu cancelled by user")
             return False
         
-        # Handle navigation based on current state
-        if self.state == MenuState.SELECTING_SNAKE1:
-            return self._handle_snake1_input(event)
-        elif self.state == MenuState.SELECTING_SNAKE2:
-            return self._handle_snake2_input(event)
+        if event.type in self.REDRAW_EVENTS:
+            self.invalidate()
+            return True
         
-        return True
+        return self._handle_keydown(event)
     
-    def _handle_snake1_input(self, event: pygame.event.Event) -> bool:
-        """Handle input for snake 1 selection"""
-        if event.key == pygame.K_UP:
-            self.snake1_selection = (self.snake1_selection - 1) % len(self.ai_options)
-            logger.debug(f"Snake 1 selection: {self.ai_options[self.snake1_selection]}")
-            
-        elif event.key == pygame.K_DOWN:
-            self.snake1_selection = (self.snake1_selection + 1) % len(self.ai_options)
-            logger.debug(f"Snake 1 selection: {self.ai_options[self.snake1_selection]}")
-            
-        elif event.key == pygame.K_RETURN:
-            self.state = MenuState.SELECTING_SNAKE2
-            logger.info(f"Snake 1 AI selected: {self.ai_options[self.snake1_selection]}")
+    def _handle_keydown(self, event: pygame.event.Event) -> bool:
+        """
+        Handle keyboard input.
         
+        Args:
+            event: Pygame keyboard event
+            
+        Returns:
+            bool: True to continue, False to exit
+        """
+        handler = self._key_handlers.get(event.key)
+        return handler() if handler else True
+    
+    def _selecting_index(self) -> Optional[int]:
+        """Index into selections being chosen, or None outside the selection states"""
+        if self.state <= MenuState.SELECTING_SNAKE2:
+            return self.state.value - 1
+        return None
+    
+    def _on_up(self) -> bool:
+        """Move the current snake's selection up one option"""
+        idx = self._selecting_index()
+        if idx is not None:
+            selections = self.selections
+            selections[idx] = self._prev_idx[selections[idx]]
+            logger.debug(f"Snake {idx + 1} selection: {self.ai_options[selections[idx]]}")
         return True
     
-    def _handle_snake2_input(self, event: pygame.event.Event) -> bool:
-        """Handle input for snake 2 selection"""
-        if event.key == pygame.K_UP:
-            self.snake2_selection = (self.snake2_selection - 1) % len(self.ai_options)
-            logger.debug(f"Snake 2 selection: {self.ai_options[self.snake2_selection]}")
-            
-        elif event.key == pygame.K_DOWN:
-            self.snake2_selection = (self.snake2_selection + 1) % len(self.ai_options)
-            logger.debug(f"Snake 2 selection: {self.ai_options[self.snake2_selection]}")
-            
-        elif event.key == pygame.K_RETURN:
-            self.state = MenuState.COMPLETE
-            logger.info(f"Snake 2 AI selected: {self.ai_options[self.snake2_selection]}")
-            return True
-        
+    def _on_down(self) -> bool:
+        """Move the current snake's selection down one option"""
+        idx = self._selecting_index()
+        if idx is not None:
+            selections = self.selections
+            selections[idx] = self._next_idx[selections[idx]]
+            logger.debug(f"Snake {idx + 1} selection: {self.ai_options[selections[idx]]}")
         return True
     
+    def _on_enter(self) -> bool:
+        """Confirm the current snake's selection and advance the menu"""
+        idx = self._selecting_index()
+        if idx is not None:
+            self.state = MenuState.SELECTING_SNAKE2 if idx == 0 else MenuState.COMPLETE
+            logger.info(f"Snake {idx + 1} AI selected: {self.ai_options[self.selections[idx]]}")
+        return True
+    
+    def _on_escape(self) -> bool:
+        """Cancel the menu"""
+        self.state = MenuState.CANCELLED
+        logger.info("Menu cancelled by user")
+        return False
+    
     def run(self) -> Optional[Tuple[str, str]]:
         """
         Run the menu loop and return selected AI types.
@@ -422,23 +634,28 @@ class AISelectionMenu:
         try:
             running = True
             
-            while running and self.state not in [MenuState.COMPLETE, MenuState.CANCELLED]:
+            # Sleep in SDL until input arrives, waking at least once per
+            # frame so the selection box keeps animating
+            timeout_ms = 1000 // self.config.fps
+            
+            while running and self.state <= MenuState.SELECTING_SNAKE2:
                 # Handle events
-                running = self.handle_events()
+                event = pygame.event.wait(timeout_ms)
+                if event.type != pygame.NOEVENT:
+                    running = self._dispatch_event(event)
+                    if running and self.state != MenuState.COMPLETE:
+                        running = self.handle_events()
                 
                 # Draw menu
                 self.draw()
-                
-                # Control frame rate
-                self.clock.tick(self.config.fps)
             
-            # Disable key repeat when done
-            pygame.key.set_repeat()
+            # Disable key repeat and event filtering when done
+            self._restore_input()
             
             # Return results
             if self.state == MenuState.COMPLETE:
-                result = (self.ai_options[self.snake1_selection], 
-                         self.ai_options[self.snake2_selection])
+                result = (self.ai_options[self.selections[0]], 
+                         self.ai_options[self.selections[1]])
                 logger.info(f"Menu completed with selections: {result}")
                 return result
             else:
@@ -447,13 +664,30 @@ class AISelectionMenu:
                 
         except Exception as e:
             logger.error(f"Fatal error in menu run loop: {e}")
-            pygame.key.set_repeat()  # Ensure key repeat is disabled
+            self._restore_input()  # Ensure key repeat and filtering are disabled
             return None
     
+    def _install_input(self) -> None:
+        """Enable key repeat and filter the event queue down to HANDLED_EVENTS"""
+        # Enable key repeat for smoother navigation
+        pygame.key.set_repeat(self.config.key_repeat_delay, self.config.key_repeat_interval)
+        
+        # Have SDL drop everything else (mouse motion, other window events)
+        # before it is turned into Python event objects
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self.HANDLED_EVENTS))
+    
+    def _restore_input(self) -> None:
+        """Disable key repeat and let every event type through again"""
+        pygame.key.set_repeat()
+        pygame.event.set_allowed(None)
+    
     def reset(self) -> None:
         """Reset menu to initial state"""
-        self.snake1_selection = 0
-        self.snake2_selection = 0
+        self.selections = [0, 0]
         self.state = MenuState.SELECTING_SNAKE1
         self.frame_count = 0
+        self._drawn_state = None
+        # run() cleared these when it finished
+        self._install_input()
         logger.debug("Menu reset to initial state")
\ No newline at end of file
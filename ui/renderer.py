@@ -14,13 +14,17 @@ Version: 1.0.0
 
 import pygame
 import logging
+from collections import OrderedDict
 from typing import Optional, Tuple, List, Dict
 from dataclasses import dataclass
 import time
 
+import numpy as np
+
 from config import *
 from models.snake import Snake
 from game.game_state import GameState
+from utils.render_math import in_bounds_mask, grid_to_pixels
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -50,9 +54,13 @@ class RenderConfig:
     game_over_overlay_alpha: int = 200
     
     # Performance
+    text_cache_size: int = 256  # rendered text surfaces kept for reuse
     enable_grid: bool = True
     enable_animations: bool = True
     fps_display: bool = False
+    use_dirty_rects: bool = True  # update only the cells that changed
+    max_dirty_cells: int = 64  # above this a full flip is cheaper
+    body_fill: Optional[bool] = None  # fill vs blit body segments; None benchmarks
 
 
 class Renderer:
@@ -69,6 +77,9 @@ class Renderer:
         surfaces: Pre-rendered surfaces for performance
     """
     
+    # Frames between checks of whether warnings are enabled
+    LOG_LEVEL_CHECK_FRAMES = 60
+    
     def __init__(self, screen: pygame.Surface, config: Optional[RenderConfig] = None) -> None:
         """
         Initialize the renderer.
@@ -95,6 +106,11 @@ class Renderer:
         if self.screen_width <= 0 or self.screen_height <= 0:
             raise RenderError(f"Invalid screen dimensions: {self.screen_width}x{self.screen_height}")
         
+        # Cached surfaces are converted to the screen format so blits stay on
+        # SDL's same-format fast path; that needs a true-color screen
+        if self.screen.get_bitsize() not in (24, 32):
+            raise RenderError(f"Unsupported screen depth: {self.screen.get_bitsize()} bits")
+        
         # Use provided config or defaults
         self.config = config or RenderConfig()
         
@@ -103,15 +119,68 @@ class Renderer:
             self._init_fonts()
             self._init_surfaces()
             
+            # Grid cell -> top-left pixel lookup tables; the lists are what
+            # the drawing loops index, since list lookups beat ndarray scalars
+            self._px = np.arange(GRID_WIDTH, dtype=np.int32) * GRID_SIZE
+            self._py = np.arange(GRID_HEIGHT, dtype=np.int32) * GRID_SIZE + UI_HEIGHT
+            self._px_list: List[int] = self._px.tolist()
+            self._py_list: List[int] = self._py.tolist()
+            
+            # Rendered text keyed by (text, font key, color), least recently
+            # used first; labels only re-render when their text changes
+            self._text_cache: "OrderedDict[Tuple[str, str, Tuple[int, int, int]], pygame.Surface]" = OrderedDict()
+            
+            # Whether per-frame warnings would be emitted; refreshed every
+            # LOG_LEVEL_CHECK_FRAMES frames so hot paths skip formatting. The
+            # countdown is separate from frame_count, which the FPS display
+            # resets every second
+            self._warn_enabled = logger.isEnabledFor(logging.WARNING)
+            self._log_check_countdown = self.LOG_LEVEL_CHECK_FRAMES
+            
             # Performance tracking
             self.frame_count = 0
             self.last_fps_update = time.time()
             self.current_fps = 0
             
+            # FPS label, re-rendered only when the whole-number FPS changes
+            self._fps_surf: Optional[pygame.Surface] = None
+            self._last_fps_int = -1
+            
             # Cache for optimization
             self._grid_surface = None
             self._last_grid_size = None
             
+            # What the last frame left on screen, for dirty-rect updates;
+            # None forces the next frame to be drawn in full
+            self._cell_codes: Optional[np.ndarray] = None
+            self._last_food: Optional[Tuple[int, int]] = None
+            self._last_state: Optional[GameState] = None
+            self._ui_update_rect = pygame.Rect(0, 0, WINDOW_WIDTH,
+                                               UI_HEIGHT + self.config.ui_border_width)
+            
+            # Reusable screen and grid-surface rects for repainted cells; at
+            # most max_dirty_cells plus the two food cells are needed a frame
+            pool_size = self.config.max_dirty_cells + 2
+            self._cell_rect_pool = [pygame.Rect(0, 0, GRID_SIZE, GRID_SIZE) for _ in range(pool_size)]
+            self._grid_rect_pool = [pygame.Rect(0, 0, GRID_SIZE, GRID_SIZE) for _ in range(pool_size)]
+            
+            # The stats panel lives on its own surface and is only re-rendered
+            # when the values it shows change
+            self._ui_surface = pygame.Surface((WINDOW_WIDTH, UI_HEIGHT)).convert(self.screen)
+            self._ui_dirty = True
+            self._ui_key: Optional[tuple] = None
+            
+            # Each snake's four stat lines composed onto one surface, rebuilt
+            # only when that snake's values change
+            self._stats_surf: Dict[int, Optional[pygame.Surface]] = {1: None, 2: None}
+            self._stats_key: Dict[int, Optional[tuple]] = {1: None, 2: None}
+            
+            # The finished game-over frame, replayed while the result stands
+            self._game_over_cache = pygame.Surface(self.screen.get_size()).convert(self.screen)
+            self._game_over_key: Optional[tuple] = None
+            
+            self._check_surface_formats()
+                                               
         except Exception as e:
             logger.error(f"Failed to initialize renderer: {e}")
             raise RenderError(f"Renderer initialization failed: {e}")
@@ -148,21 +217,179 @@ class Renderer:
     
     def _init_surfaces(self) -> None:
         """Initialize reusable surfaces for performance"""
+        self._init_segment_surfaces()
+        self._init_food_surfaces()
+        
         self.surfaces = {}
         
-        try:
-            # Create UI panel surface
-            self.surfaces['ui_panel'] = pygame.Surface((WINDOW_WIDTH, UI_HEIGHT))
-            self.surfaces['ui_panel'].set_alpha(self.config.ui_panel_alpha)
+        # Both panels are solid black with a constant alpha, so fill them once
+        # here and convert them to the screen format; frames only blit them.
+        # Failures propagate so a broken renderer is caught at construction.
+        
+        # Create UI panel surface
+        ui_panel = pygame.Surface((WINDOW_WIDTH, UI_HEIGHT))
+        ui_panel.fill(BLACK)
+        ui_panel = ui_panel.convert(self.screen)
+        ui_panel.set_alpha(self.config.ui_panel_alpha)
+        self.surfaces['ui_panel'] = ui_panel
+        
+        # Create game over overlay
+        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        overlay.fill(BLACK)
+        overlay = overlay.convert(self.screen)
+        overlay.set_alpha(self.config.game_over_overlay_alpha)
+        self.surfaces['game_over_overlay'] = overlay
+    
+    def _init_food_surfaces(self) -> None:
+        """
+        Pre-render the food square for every frame of its pulse.
+        
+        self._food_pulse[i] is the (surface, offset) pair for frame i of the
+        60-frame cycle, with offset centering the square in its cell; frames
+        with the same size share one surface.
+        """
+        sized: Dict[int, pygame.Surface] = {}
+        
+        def food_surface(size: int) -> pygame.Surface:
+            if size not in sized:
+                surface = pygame.Surface((size, size))
+                surface.fill(RED)
+                sized[size] = surface.convert(self.screen)
+            return sized[size]
+        
+        self._food_pulse: List[Tuple[pygame.Surface, int]] = []
+        for frame in range(60):
+            pulse = abs(frame - 30) / 30
+            size = int(GRID_SIZE * (0.8 + 0.2 * pulse))
+            self._food_pulse.append((food_surface(size), (GRID_SIZE - size) // 2))
+        
+        self._food_surface = food_surface(GRID_SIZE)
+    
+    def _init_segment_surfaces(self) -> None:
+        """
+        Pre-render one cell-sized surface per snake, segment kind and alive state.
+        
+        Keys are (snake_id, 'head' | 'body', alive). Dead snakes of either id
+        share the gray palette.
+        """
+        snake_colors = {1: (ORANGE, DARK_ORANGE), 2: (CYAN, DARK_CYAN)}
+        dead_colors = (GRAY, (64, 64, 64))
+        
+        self._seg_surfaces: Dict[Tuple[int, str, bool], pygame.Surface] = {}
+        self._body_colors: Dict[Tuple[int, bool], Tuple[int, int, int]] = {}
+        for snake_id, alive_colors in snake_colors.items():
+            for alive, (head_color, body_color) in ((True, alive_colors), (False, dead_colors)):
+                self._body_colors[(snake_id, alive)] = body_color
+                
+                head = pygame.Surface((GRID_SIZE, GRID_SIZE))
+                head.fill(head_color)
+                if self.config.enable_animations:
+                    # Border on the head for better visibility
+                    pygame.draw.rect(head, BLACK, head.get_rect(), 1)
+                
+                body = pygame.Surface((GRID_SIZE, GRID_SIZE))
+                body.fill(body_color)
+                
+                self._seg_surfaces[(snake_id, 'head', alive)] = head.convert(self.screen)
+                self._seg_surfaces[(snake_id, 'body', alive)] = body.convert(self.screen)
+        
+        # Body segments are plain squares, so they can be filled instead of
+        # blitted; pick whichever is faster here unless configured
+        if self.config.body_fill is None:
+            self._use_body_fill = self._benchmark_body_fill()
+        else:
+            self._use_body_fill = self.config.body_fill
+        
+        # Small integer code per segment surface for the per-cell screen map;
+        # code 0 is an empty cell
+        self._seg_codes: Dict[Tuple[int, str, bool], int] = {}
+        self._code_surfaces: List[Optional[pygame.Surface]] = [None]
+        for key, surface in self._seg_surfaces.items():
+            self._seg_codes[key] = len(self._code_surfaces)
+            self._code_surfaces.append(surface)
+    
+    def _check_surface_formats(self) -> None:
+        """
+        Verify that every cached surface matches the screen's pixel format.
+        
+        Per-pixel alpha surfaces only need matching color channels.
+        
+        Raises:
+            RenderError: If a surface would need conversion on every blit
+        """
+        screen_masks = self.screen.get_masks()
+        cached = (list(self.surfaces.items())
+                  + list(self._seg_surfaces.items())
+                  + [(('food', i), surf) for i, (surf, _) in enumerate(self._food_pulse)]
+                  + [('food', self._food_surface), ('ui', self._ui_surface)])
+        
+        for name, surface in cached:
+            masks = surface.get_masks()
+            if surface.get_flags() & pygame.SRCALPHA:
+                matches = masks[:3] == screen_masks[:3]
+            else:
+                matches = masks == screen_masks
+            if not matches:
+                raise RenderError(f"Surface {name} does not match the screen format")
+    
+    def _benchmark_body_fill(self, segments: int = 32, rounds: int = 10) -> bool:
+        """
+        Time filling against blitting a row of body segments.
+        
+        Runs on an off-screen surface in the screen's format.
+        
+        Args:
+            segments: Number of segments drawn per round
+            rounds: Number of timed rounds for each method
             
-            # Create game over overlay
-            self.surfaces['game_over_overlay'] = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            self.surfaces['game_over_overlay'].set_alpha(self.config.game_over_overlay_alpha)
+        Returns:
+            True if filling was faster
+        """
+        target = pygame.Surface(self.screen.get_size()).convert(self.screen)
+        body_surf = self._seg_surfaces[(1, 'body', True)]
+        color = self._body_colors[(1, True)]
+        positions = [((i * GRID_SIZE) % WINDOW_WIDTH, UI_HEIGHT) for i in range(segments)]
+        
+        start = time.perf_counter()
+        for _ in range(rounds):
+            target.blits([(body_surf, pos) for pos in positions], doreturn=0)
+        blit_time = time.perf_counter() - start
+        
+        fill = target.fill
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for x, y in positions:
+                fill(color, (x, y, GRID_SIZE, GRID_SIZE))
+        fill_time = time.perf_counter() - start
+        
+        logger.debug(f"Body segment drawing: blits {blit_time:.6f}s, fill {fill_time:.6f}s")
+        return fill_time < blit_time
+    
+    def _render_text(self, text: str, font_key: str,
+                     color: Tuple[int, int, int]) -> pygame.Surface:
+        """
+        Render text through the LRU text cache.
+        
+        Args:
+            text: String to render
+            font_key: Key into self.fonts ('main', 'big' or 'small')
+            color: RGB text color
             
-        except Exception as e:
-            logger.error(f"Failed to create surfaces: {e}")
-            # Continue without pre-created surfaces
-            self.surfaces = {}
+        Returns:
+            Antialiased text surface in the screen's pixel format
+        """
+        cache = self._text_cache
+        key = (text, font_key, color)
+        surface = cache.get(key)
+        if surface is not None:
+            cache.move_to_end(key)
+            return surface
+        
+        surface = self.fonts[font_key].render(text, True, color).convert_alpha(self.screen)
+        cache[key] = surface
+        if len(cache) > self.config.text_cache_size:
+            cache.popitem(last=False)
+        return surface
     
     def draw(self, game_state: GameState) -> None:
         """
@@ -175,311 +402,494 @@ class Renderer:
             RenderError: If rendering fails critically
         """
         try:
-            # Validate game state
-            if not isinstance(game_state, GameState):
-                raise RenderError("Invalid game state provided")
-            
-            # Clear screen
-            self.screen.fill(BLACK)
-            
-            # Draw game elements in order
-            if self.config.enable_grid:
-                self._draw_grid()
-            
-            # Draw game objects
-            self._draw_game_objects(game_state)
-            
-            # Draw UI
-            self._draw_ui(game_state)
+            codes = None
+            dirty_cells = None
+            if not game_state.game_over:
+                self._game_over_key = None
+            
+            if game_state.game_over and self._game_over_key == self._get_game_over_key(game_state):
+                # Nothing changes once the game has ended; replay that frame
+                self.screen.blit(self._game_over_cache, (0, 0))
+            else:
+                if self.config.use_dirty_rects:
+                    codes = self._build_cell_codes(game_state)
+                    dirty_cells = self._find_dirty_cells(game_state, codes)
+                
+                if dirty_cells is None:
+                    self._draw_full(game_state)
+                else:
+                    dirty_rects = self._draw_dirty(game_state, codes, dirty_cells)
             
-            # Draw FPS if enabled
+            # Draw FPS if enabled (it lies inside the UI panel)
             if self.config.fps_display:
                 self._draw_fps()
             
             # Update display
-            pygame.display.flip()
+            if dirty_cells is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)
+            
+            # Remember what is on screen now; the game over overlay darkens
+            # every cell, so the frame after it is drawn in full
+            self._cell_codes = None if game_state.game_over else codes
+            self._last_food = game_state.food
+            self._last_state = game_state
             
             # Update frame counter
             self.frame_count += 1
+            self._log_check_countdown -= 1
+            if not self._log_check_countdown:
+                self._log_check_countdown = self.LOG_LEVEL_CHECK_FRAMES
+                self._warn_enabled = logger.isEnabledFor(logging.WARNING)
             
         except Exception as e:
             logger.error(f"Critical rendering error: {e}")
+            # The failed frame and the error screen no longer match the
+            # cached cell codes or game over frame; draw the next one in full
+            self.invalidate()
+            self._game_over_key = None
             # Try to show error on screen
             self._draw_error_state(str(e))
             raise RenderError(f"Failed to render frame: {e}")
     
-    def _draw_game_objects(self, game_state: GameState) -> None:
-        """Draw all game objects (snakes and food)"""
-        try:
-            # Draw snakes
-            if hasattr(game_state, 'snake1') and game_state.snake1:
-                self._draw_snake(game_state.snake1, ORANGE, DARK_ORANGE)
+    def invalidate(self) -> None:
+        """
+        Force the next frame to be drawn and presented in full.
+        
+        Call this after anything else has drawn on the screen, such as the
+        menu or an error overlay, or when the window contents were lost.
+        """
+        self._cell_codes = None
+    
+    def _draw_full(self, game_state: GameState) -> None:
+        """Draw every element of the frame onto a cleared screen"""
+        # Clear screen
+        self.screen.fill(BLACK)
+        
+        # Draw game elements in order
+        if self.config.enable_grid:
+            self._draw_grid()
+        
+        # Draw game objects
+        self._draw_game_objects(game_state)
+        
+        # Draw UI
+        self._draw_ui(game_state)
+    
+    def _build_cell_codes(self, game_state: GameState) -> np.ndarray:
+        """
+        Map every grid cell to the code of the segment surface drawn there.
+        
+        Snakes are written in drawing order so that, as on screen, later
+        segments win where they overlap. Off-grid segments are skipped.
+        
+        Args:
+            game_state: Game state being drawn
             
-            if hasattr(game_state, 'snake2') and game_state.snake2:
-                self._draw_snake(game_state.snake2, CYAN, DARK_CYAN)
+        Returns:
+            (GRID_WIDTH, GRID_HEIGHT) int8 array of surface codes
+        """
+        codes = np.zeros((GRID_WIDTH, GRID_HEIGHT), dtype=np.int8)
+        
+        for snake_id, snake in ((1, game_state.snake1), (2, game_state.snake2)):
+            if snake is None or not snake.get_length():
+                continue
+            
+            alive = bool(snake.alive)
+            xs = snake.body_x
+            ys = snake.body_y
+            valid = in_bounds_mask(xs, ys, GRID_WIDTH, GRID_HEIGHT)
+            if valid[0]:
+                codes[xs[0], ys[0]] = self._seg_codes[(snake_id, 'head', alive)]
+            
+            body_valid = valid[1:]
+            codes[xs[1:][body_valid], ys[1:][body_valid]] = self._seg_codes[(snake_id, 'body', alive)]
+        
+        return codes
+    
+    def _find_dirty_cells(self, game_state: GameState,
+                          codes: np.ndarray) -> Optional[List[Tuple[int, int]]]:
+        """
+        Find the grid cells that must be repainted this frame.
+        
+        Args:
+            game_state: Game state being drawn
+            codes: Cell codes for this frame from _build_cell_codes()
             
-            # Draw food
-            if hasattr(game_state, 'food') and game_state.food:
-                self._draw_food(game_state.food)
-                
-        except Exception as e:
-            logger.error(f"Error drawing game objects: {e}")
+        Returns:
+            List of (x, y) cells, or None when the frame must be drawn in full
+        """
+        # A new game, a game over overlay or foreign drawing needs a full frame
+        if (self._cell_codes is None or game_state.game_over
+                or game_state is not self._last_state):
+            return None
+        
+        changed = np.argwhere(codes != self._cell_codes)
+        if len(changed) > self.config.max_dirty_cells:
+            return None
+        
+        cells = set(map(tuple, changed.tolist()))
+        
+        # The food pulses every frame, and its old cell must be cleared;
+        # GameState guarantees it is an in-bounds (x, y) tuple
+        for food in (self._last_food, game_state.food):
+            if food is not None:
+                cells.add(food)
+        
+        return list(cells)
+    
+    def _draw_dirty(self, game_state: GameState, codes: np.ndarray,
+                    cells: List[Tuple[int, int]]) -> List[pygame.Rect]:
+        """
+        Repaint only the given cells and the UI panel.
+        
+        Args:
+            game_state: Game state being drawn
+            codes: Cell codes for this frame from _build_cell_codes()
+            cells: (x, y) cells to repaint
+            
+        Returns:
+            Screen rectangles that changed
+        """
+        screen = self.screen
+        grid = self._grid_surface if self.config.enable_grid else None
+        code_surfaces = self._code_surfaces
+        cell_rects = self._cell_rect_pool
+        grid_rects = self._grid_rect_pool
+        dirty_rects = []
+        
+        for i, (x, y) in enumerate(cells):
+            # Point pooled rects at the cell instead of allocating new ones
+            rect = cell_rects[i]
+            rect.x = self._px_list[x]
+            rect.y = self._py_list[y]
+            
+            # Restore the background, then whatever segment covers the cell
+            if grid is not None:
+                area = grid_rects[i]
+                area.x = rect.x
+                area.y = rect.y - UI_HEIGHT
+                screen.blit(grid, rect, area)
+            else:
+                screen.fill(BLACK, rect)
+            
+            surface = code_surfaces[codes[x, y]]
+            if surface is not None:
+                screen.blit(surface, rect)
+            
+            dirty_rects.append(rect)
+        
+        # Food goes on top of the snakes, as in a full frame
+        if game_state.food is not None:
+            self._draw_food(game_state.food)
+        
+        # The panel is blitted every frame but only presented when it changed;
+        # the FPS label is drawn over it and may change on any frame
+        if self._draw_ui(game_state) or self.config.fps_display:
+            dirty_rects.append(self._ui_update_rect)
+        
+        return dirty_rects
+    
+    def _draw_game_objects(self, game_state: GameState) -> None:
+        """Draw all game objects (snakes and food)"""
+        # Draw snakes
+        if game_state.snake1 is not None:
+            self._draw_snake(game_state.snake1, 1)
+        
+        if game_state.snake2 is not None:
+            self._draw_snake(game_state.snake2, 2)
+        
+        # Draw food
+        if game_state.food is not None:
+            self._draw_food(game_state.food)
     
     def _draw_grid(self) -> None:
         """Draw the game grid with caching for performance"""
-        try:
-            # Check if we need to regenerate grid
-            current_size = (WINDOW_WIDTH, WINDOW_HEIGHT, GRID_SIZE)
-            if self._grid_surface is None or self._last_grid_size != current_size:
-                self._generate_grid_surface()
-                self._last_grid_size = current_size
-            
-            # Blit cached grid
-            if self._grid_surface:
-                self.screen.blit(self._grid_surface, (0, UI_HEIGHT))
-                
-        except Exception as e:
-            logger.error(f"Error drawing grid: {e}")
-            # Fall back to direct drawing
-            self._draw_grid_direct()
+        # Check if we need to regenerate grid
+        current_size = (WINDOW_WIDTH, WINDOW_HEIGHT, GRID_SIZE)
+        if self._grid_surface is None or self._last_grid_size != current_size:
+            self._generate_grid_surface()
+            self._last_grid_size = current_size
+        
+        # Blit cached grid
+        if self._grid_surface:
+            self.screen.blit(self._grid_surface, (0, UI_HEIGHT))
     
     def _generate_grid_surface(self) -> None:
         """Generate cached grid surface"""
         try:
-            self._grid_surface = pygame.Surface((WINDOW_WIDTH, GAME_HEIGHT))
-            self._grid_surface.fill(BLACK)
-            self._grid_surface.set_alpha(255)
+            # Build the pixels as an (x, y, rgb) array; every GRID_SIZE-th
+            # column and row is a grid line
+            pixels = np.zeros((WINDOW_WIDTH, GAME_HEIGHT, 3), dtype=np.uint8)
+            pixels[::GRID_SIZE, :, :] = GRAY
+            pixels[:, ::GRID_SIZE, :] = GRAY
             
-            # Draw vertical lines
-            for x in range(0, WINDOW_WIDTH, GRID_SIZE):
-                pygame.draw.line(self._grid_surface, GRAY, (x, 0), (x, GAME_HEIGHT))
+            grid_surface = pygame.Surface((WINDOW_WIDTH, GAME_HEIGHT))
+            pygame.surfarray.blit_array(grid_surface, pixels)
+            self._grid_surface = grid_surface.convert(self.screen)
             
-            # Draw horizontal lines
-            for y in range(0, GAME_HEIGHT, GRID_SIZE):
-                pygame.draw.line(self._grid_surface, GRAY, (0, y), (WINDOW_WIDTH, y))
-                
         except Exception as e:
             logger.error(f"Failed to generate grid surface: {e}")
             self._grid_surface = None
     
-    def _draw_grid_direct(self) -> None:
-        """Draw grid directly without caching (fallback)"""
-        # Vertical lines
-        for x in range(0, WINDOW_WIDTH, GRID_SIZE):
-            pygame.draw.line(self.screen, GRAY, (x, UI_HEIGHT), (x, WINDOW_HEIGHT))
-        
-        # Horizontal lines
-        for y in range(UI_HEIGHT, WINDOW_HEIGHT, GRID_SIZE):
-            pygame.draw.line(self.screen, GRAY, (0, y), (WINDOW_WIDTH, y))
-    
-    def _draw_snake(self, snake: Snake, head_color: Tuple[int, int, int], 
-                   body_color: Tuple[int, int, int]) -> None:
+    def _draw_snake(self, snake: Snake, snake_id: int) -> None:
         """
         Draw a snake with proper error handling.
         
+        The head uses its pre-rendered surface. Body segments are either
+        filled as plain squares or sent in a single blits() call, whichever
+        the start-up benchmark found faster.
+        
         Args:
             snake: Snake object to draw
-            head_color: Color for the snake's head
-            body_color: Color for the snake's body
+            snake_id: 1 for the orange snake, 2 for the cyan snake
         """
         try:
             # Validate snake
-            if not snake or not hasattr(snake, 'body') or not snake.body:
-                logger.warning("Attempted to draw invalid snake")
+            if not snake or not snake.get_length():
+                if self._warn_enabled:
+                    logger.warning("Attempted to draw invalid snake")
                 return
             
-            # Determine colors based on alive status
-            if not snake.alive:
-                head_color = GRAY
-                body_color = (64, 64, 64)
-            
-            # Draw each segment
-            for i, segment in enumerate(snake.body):
-                try:
-                    x, y = segment
-                    
-                    # Validate coordinates
-                    if not (0 <= x < GRID_WIDTH and 0 <= y < GRID_HEIGHT):
-                        logger.warning(f"Snake segment out of bounds: ({x}, {y})")
-                        continue
-                    
-                    # Choose color
-                    color = head_color if i == 0 else body_color
-                    
-                    # Calculate pixel position
-                    pixel_x = x * GRID_SIZE
-                    pixel_y = y * GRID_SIZE + UI_HEIGHT
-                    
-                    # Draw segment with border for visibility
-                    segment_rect = pygame.Rect(pixel_x, pixel_y, GRID_SIZE, GRID_SIZE)
-                    pygame.draw.rect(self.screen, color, segment_rect)
-                    
-                    # Optional: Add border for better visibility
-                    if self.config.enable_animations and i == 0:  # Head only
-                        pygame.draw.rect(self.screen, BLACK, segment_rect, 1)
-                        
-                except Exception as e:
-                    logger.error(f"Error drawing snake segment {i}: {e}")
-                    continue
-                    
+            # Pick surfaces based on alive status
+            alive = bool(snake.alive)
+            head_surf = self._seg_surfaces[(snake_id, 'head', alive)]
+            body_surf = self._seg_surfaces[(snake_id, 'body', alive)]
+            
+            # Validate all coordinates at once and drop any off-grid segment
+            xs = snake.body_x
+            ys = snake.body_y
+            valid = in_bounds_mask(xs, ys, GRID_WIDTH, GRID_HEIGHT)
+            head_visible = bool(valid[0])
+            if not valid.all():
+                if self._warn_enabled:
+                    for x, y in zip(xs[~valid].tolist(), ys[~valid].tolist()):
+                        logger.warning("Snake segment out of bounds: (%d, %d)", x, y)
+                xs = xs[valid]
+                ys = ys[valid]
+            
+            # Convert every segment to pixels in one vectorized pass
+            pixel_xs, pixel_ys = grid_to_pixels(xs, ys, GRID_SIZE, UI_HEIGHT)
+            pixel_positions = list(zip(pixel_xs.tolist(), pixel_ys.tolist()))
+            
+            if self._use_body_fill:
+                # Head keeps its bordered surface; body squares are filled
+                if head_visible:
+                    self.screen.blit(head_surf, pixel_positions[0])
+                    pixel_positions = pixel_positions[1:]
+                
+                body_color = self._body_colors[(snake_id, alive)]
+                fill = self.screen.fill
+                for x, y in pixel_positions:
+                    fill(body_color, (x, y, GRID_SIZE, GRID_SIZE))
+            else:
+                blits_seq = []
+                if head_visible:
+                    blits_seq.append((head_surf, pixel_positions[0]))
+                    pixel_positions = pixel_positions[1:]
+                blits_seq += [(body_surf, pos) for pos in pixel_positions]
+                
+                self.screen.blits(blits_seq, doreturn=0)
+            
         except Exception as e:
-            logger.error(f"Error drawing snake: {e}")
+            logger.error("Error drawing snake: %s", e)
     
     def _draw_food(self, food_pos: Tuple[int, int]) -> None:
         """
-        Draw food with validation.
+        Draw food.
         
         Args:
-            food_pos: (x, y) position of food
+            food_pos: (x, y) position of food, validated by GameState.set_food()
         """
+        assert isinstance(food_pos, tuple) and len(food_pos) == 2
         try:
-            # Validate position
-            if not isinstance(food_pos, (tuple, list)) or len(food_pos) != 2:
-                logger.error(f"Invalid food position: {food_pos}")
-                return
-            
             food_x, food_y = food_pos
             
-            # Validate coordinates
-            if not (0 <= food_x < GRID_WIDTH and 0 <= food_y < GRID_HEIGHT):
-                logger.error(f"Food position out of bounds: ({food_x}, {food_y})")
-                return
-            
             # Calculate pixel position
-            pixel_x = food_x * GRID_SIZE
-            pixel_y = food_y * GRID_SIZE + UI_HEIGHT
+            pixel_x = self._px_list[food_x]
+            pixel_y = self._py_list[food_y]
             
             # Draw food with animation if enabled
             if self.config.enable_animations:
                 # Pulsing effect
-                pulse = abs((self.frame_count % 60) - 30) / 30
-                size = int(GRID_SIZE * (0.8 + 0.2 * pulse))
-                offset = (GRID_SIZE - size) // 2
-                
-                food_rect = pygame.Rect(pixel_x + offset, pixel_y + offset, size, size)
+                food_surf, offset = self._food_pulse[self.frame_count % 60]
+                self.screen.blit(food_surf, (pixel_x + offset, pixel_y + offset))
             else:
-                food_rect = pygame.Rect(pixel_x, pixel_y, GRID_SIZE, GRID_SIZE)
-            
-            pygame.draw.rect(self.screen, RED, food_rect)
+                self.screen.blit(self._food_surface, (pixel_x, pixel_y))
             
         except Exception as e:
-            logger.error(f"Error drawing food: {e}")
+            logger.error("Error drawing food: %s", e)
     
-    def _draw_ui(self, game_state: GameState) -> None:
-        """Draw the UI panel with game information"""
-        try:
-            # Draw UI background
-            if 'ui_panel' in self.surfaces:
-                self.surfaces['ui_panel'].fill(BLACK)
-                self.screen.blit(self.surfaces['ui_panel'], (0, 0))
-            else:
-                # Fallback
-                ui_rect = pygame.Rect(0, 0, WINDOW_WIDTH, UI_HEIGHT)
-                pygame.draw.rect(self.screen, BLACK, ui_rect)
-            
-            # Draw UI border
-            pygame.draw.line(self.screen, WHITE, (0, UI_HEIGHT), 
-                           (WINDOW_WIDTH, UI_HEIGHT), self.config.ui_border_width)
-            
-            # Draw snake stats
-            if hasattr(game_state, 'snake1') and game_state.snake1:
-                ai1_type = getattr(game_state, 'ai1_type', 'Unknown')
-                self._draw_snake_stats(game_state.snake1, 20, ORANGE, "ORANGE", ai1_type)
-            
-            if hasattr(game_state, 'snake2') and game_state.snake2:
-                ai2_type = getattr(game_state, 'ai2_type', 'Unknown')
-                self._draw_snake_stats(game_state.snake2, WINDOW_WIDTH - 200, CYAN, "CYAN", ai2_type)
-            
-            # Draw center information
-            self._draw_center_info(game_state)
-            
-            # Draw game over overlay if needed
-            if hasattr(game_state, 'game_over') and game_state.game_over:
-                self._draw_game_over(game_state)
-                
-        except Exception as e:
-            logger.error(f"Error drawing UI: {e}")
+    def _mark_ui_dirty(self) -> None:
+        """Make the next _draw_ui() call re-render the stats panel"""
+        self._ui_dirty = True
     
-    def _draw_snake_stats(self, snake: Snake, x_pos: int, color: Tuple[int, int, int], 
-                         title: str, ai_type: Optional[str] = None) -> None:
-        """Draw statistics for a single snake"""
-        try:
-            # Title with AI type
-            if ai_type and ai_type != 'Unknown':
-                title_text = self.font.render(f"{title} ({ai_type})", True, color)
-            else:
-                title_text = self.font.render(title, True, color)
-            self.screen.blit(title_text, (x_pos, 10))
-            
-            # Score
-            score_text = self.font.render(f"Score: {snake.score}", True, WHITE)
-            self.screen.blit(score_text, (x_pos, 35))
-            
-            # Length
-            length_text = self.small_font.render(f"Length: {len(snake.body)}", True, WHITE)
-            self.screen.blit(length_text, (x_pos, 55))
-            
-            # Status
-            status_color = color if snake.alive else RED
-            status_text = self.small_font.render(
-                f"Status: {'ALIVE' if snake.alive else 'DEAD'}", 
-                True, status_color
-            )
-            self.screen.blit(status_text, (x_pos, 75))
+    def _draw_ui(self, game_state: GameState) -> bool:
+        """
+        Draw the UI panel with game information.
+        
+        Args:
+            game_state: Game state being drawn
             
-        except Exception as e:
-            logger.error(f"Error drawing snake stats: {e}")
+        Returns:
+            True if the panel contents were re-rendered this frame
+        """
+        rendered = False
+        # Re-render the panel only when a value it shows has changed
+        snake1 = game_state.snake1
+        snake2 = game_state.snake2
+        ui_key = (
+            game_state.food, game_state.ai1_type, game_state.ai2_type,
+            None if snake1 is None else (snake1.score, snake1.get_length(), snake1.alive),
+            None if snake2 is None else (snake2.score, snake2.get_length(), snake2.alive)
+        )
+        if ui_key != self._ui_key:
+            self._ui_key = ui_key
+            self._mark_ui_dirty()
+        
+        if self._ui_dirty:
+            self._render_ui_panel(game_state)
+            self._ui_dirty = False
+            rendered = True
+        
+        self.screen.blit(self._ui_surface, (0, 0))
+        
+        # Draw UI border
+        pygame.draw.line(self.screen, WHITE, (0, UI_HEIGHT), 
+                       (WINDOW_WIDTH, UI_HEIGHT), self.config.ui_border_width)
+        
+        # Draw game over overlay if needed
+        if game_state.game_over:
+            self._draw_game_over(game_state)
+        
+        return rendered
+    
+    def _render_ui_panel(self, game_state: GameState) -> None:
+        """Render the stats panel contents into the UI surface"""
+        # Draw UI background
+        self._ui_surface.fill(BLACK)
+        self._ui_surface.blit(self.surfaces['ui_panel'], (0, 0))
+        
+        # Draw snake stats
+        if game_state.snake1 is not None:
+            ai1_type = game_state.ai1_type or 'Unknown'
+            self._draw_snake_stats(game_state.snake1, 1, 20, ORANGE, "ORANGE", ai1_type)
+        
+        if game_state.snake2 is not None:
+            ai2_type = game_state.ai2_type or 'Unknown'
+            self._draw_snake_stats(game_state.snake2, 2, WINDOW_WIDTH - 200, CYAN, "CYAN", ai2_type)
+        
+        # Draw center information
+        self._draw_center_info(game_state)
+    
+    def _draw_snake_stats(self, snake: Snake, snake_id: int, x_pos: int,
+                         color: Tuple[int, int, int], title: str,
+                         ai_type: Optional[str] = None) -> None:
+        """
+        Draw statistics for a single snake.
+        
+        The stat lines are composed onto one surface per snake that is only
+        rebuilt when the values change, so drawing them is a single blit.
+        """
+        key = (snake.score, snake.get_length(), snake.alive, title, ai_type)
+        if key != self._stats_key[snake_id]:
+            # Record the key only once composing succeeded, so a failure is
+            # retried next frame instead of leaving a stale surface cached
+            self._compose_snake_stats(snake, snake_id, x_pos, color, title, ai_type)
+            self._stats_key[snake_id] = key
+        
+        self._ui_surface.blit(self._stats_surf[snake_id], (x_pos, 0))
+    
+    def _compose_snake_stats(self, snake: Snake, snake_id: int, x_pos: int,
+                             color: Tuple[int, int, int], title: str,
+                             ai_type: Optional[str]) -> None:
+        """Render a snake's stat lines onto its stats surface"""
+        # Title with AI type
+        if ai_type and ai_type != 'Unknown':
+            title_text = self._render_text(f"{title} ({ai_type})", 'main', color)
+        else:
+            title_text = self._render_text(title, 'main', color)
+        
+        # Score
+        score_text = self._render_text(f"Score: {snake.score}", 'main', WHITE)
+        
+        # Length
+        length_text = self._render_text(f"Length: {snake.get_length()}", 'small', WHITE)
+        
+        # Status
+        status_color = color if snake.alive else RED
+        status_text = self._render_text(
+            f"Status: {'ALIVE' if snake.alive else 'DEAD'}", 
+            'small', status_color
+        )
+        
+        lines = ((title_text, 10), (score_text, 35), (length_text, 55), (status_text, 75))
+        width = max(text.get_width() for text, _ in lines)
+        
+        # Reuse the surface unless the text has outgrown it
+        stats_surf = self._stats_surf[snake_id]
+        if stats_surf is None or stats_surf.get_width() < width:
+            stats_surf = pygame.Surface((width, UI_HEIGHT)).convert(self.screen)
+            self._stats_surf[snake_id] = stats_surf
+        
+        # Start from the freshly drawn panel background under the stats
+        stats_surf.blit(self._ui_surface, (0, 0), (x_pos, 0, stats_surf.get_width(), UI_HEIGHT))
+        stats_surf.blits([(text, (0, y)) for text, y in lines], doreturn=0)
     
     def _draw_center_info(self, game_state: GameState) -> None:
         """Draw central game information"""
-        try:
-            center_x = WINDOW_WIDTH // 2
-            
-            # Game title
-            game_title = self.font.render("AI SNAKE BATTLE", True, YELLOW)
-            title_rect = game_title.get_rect(center=(center_x, 25))
-            self.screen.blit(game_title, title_rect)
-            
-            # Food position
-            if hasattr(game_state, 'food') and game_state.food:
-                food_info = self.small_font.render(
-                    f"Food at ({game_state.food[0]}, {game_state.food[1]})", 
-                    True, WHITE
-                )
-                food_rect = food_info.get_rect(center=(center_x, 50))
-                self.screen.blit(food_info, food_rect)
-            
-            # Game mode
-            speed_info = self.small_font.render("FAST MODE", True, WHITE)
-            speed_rect = speed_info.get_rect(center=(center_x, 70))
-            self.screen.blit(speed_info, speed_rect)
-            
-        except Exception as e:
-            logger.error(f"Error drawing center info: {e}")
+        center_x = WINDOW_WIDTH // 2
+        
+        # Game title
+        game_title = self._render_text("AI SNAKE BATTLE", 'main', YELLOW)
+        title_rect = game_title.get_rect(center=(center_x, 25))
+        self._ui_surface.blit(game_title, title_rect)
+        
+        # Food position
+        if game_state.food is not None:
+            food_info = self._render_text(
+                f"Food at ({game_state.food[0]}, {game_state.food[1]})", 
+                'small', WHITE
+            )
+            food_rect = food_info.get_rect(center=(center_x, 50))
+            self._ui_surface.blit(food_info, food_rect)
+        
+        # Game mode
+        speed_info = self._render_text("FAST MODE", 'small', WHITE)
+        speed_rect = speed_info.get_rect(center=(center_x, 70))
+        self._ui_surface.blit(speed_info, speed_rect)
+    
+    def _get_game_over_key(self, game_state: GameState) -> tuple:
+        """Key identifying what the game-over screen shows for a game state"""
+        winner = game_state.winner
+        return (
+            game_state,
+            None if winner is None else (winner.name, winner.score, winner.get_length()),
+            None if game_state.snake1 is None else game_state.snake1.score,
+            None if game_state.snake2 is None else game_state.snake2.score
+        )
     
     def _draw_game_over(self, game_state: GameState) -> None:
-        """Draw game over overlay with results"""
+        """
+        Draw game over overlay with results.
+        
+        The finished frame is copied to the game-over cache, which draw()
+        replays on later frames while the key stays the same.
+        """
         try:
             # Draw overlay
-            if 'game_over_overlay' in self.surfaces:
-                self.surfaces['game_over_overlay'].fill(BLACK)
-                self.screen.blit(self.surfaces['game_over_overlay'], (0, 0))
-            else:
-                # Fallback
-                overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-                overlay.set_alpha(self.config.game_over_overlay_alpha)
-                overlay.fill(BLACK)
-                self.screen.blit(overlay, (0, 0))
+            self.screen.blit(self.surfaces['game_over_overlay'], (0, 0))
             
             # Determine winner and stats
-            winner = getattr(game_state, 'winner', None)
+            winner = game_state.winner
             
             if winner:
                 # Winner announcement
                 winner_color = ORANGE if winner == game_state.snake1 else CYAN
-                winner_text = self.big_font.render(
+                winner_text = self._render_text(
                     f"{winner.name.upper()} WINS!", 
-                    True, winner_color
+                    'big', winner_color
                 )
                 
                 # Winner stats
@@ -490,7 +900,7 @@ class Renderer:
                 ]
             else:
                 # Tie game
-                winner_text = self.big_font.render("IT'S A TIE!", True, YELLOW)
+                winner_text = self._render_text("IT'S A TIE!", 'big', YELLOW)
                 
                 # Tie stats
                 stats_lines = [
@@ -505,39 +915,43 @@ class Renderer:
             
             # Draw stats
             for i, line in enumerate(stats_lines):
-                stat_text = self.font.render(line, True, WHITE)
+                stat_text = self._render_text(line, 'main', WHITE)
                 stat_rect = stat_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 30 + i * 30))
                 self.screen.blit(stat_text, stat_rect)
             
             # Draw instructions
-            restart_text = self.font.render("Press R to Restart | Press Q to Quit", True, WHITE)
+            restart_text = self._render_text("Press R to Restart | Press Q to Quit", 'main', WHITE)
             restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 80))
             self.screen.blit(restart_text, restart_rect)
             
             # Performance info
-            performance_text = self.small_font.render("High-Speed AI Battle Mode Active", True, GRAY)
+            performance_text = self._render_text("High-Speed AI Battle Mode Active", 'small', GRAY)
             perf_rect = performance_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 120))
             self.screen.blit(performance_text, perf_rect)
             
+            # Keep the finished frame for the rest of the game-over screen
+            self._game_over_cache.blit(self.screen, (0, 0))
+            self._game_over_key = self._get_game_over_key(game_state)
+            
         except Exception as e:
             logger.error(f"Error drawing game over screen: {e}")
     
     def _draw_fps(self) -> None:
         """Draw FPS counter for performance monitoring"""
-        try:
-            # Update FPS calculation
-            current_time = time.time()
-            if current_time - self.last_fps_update > 1.0:
-                self.current_fps = self.frame_count / (current_time - self.last_fps_update)
-                self.frame_count = 0
-                self.last_fps_update = current_time
-            
-            # Draw FPS
-            fps_text = self.small_font.render(f"FPS: {self.current_fps:.1f}", True, YELLOW)
-            self.screen.blit(fps_text, (10, 10))
-            
-        except Exception as e:
-            logger.error(f"Error drawing FPS: {e}")
+        # Update FPS calculation
+        current_time = time.time()
+        if current_time - self.last_fps_update > 1.0:
+            self.current_fps = self.frame_count / (current_time - self.last_fps_update)
+            self.frame_count = 0
+            self.last_fps_update = current_time
+        
+        # Re-render the label only when the displayed value changes
+        fps_int = int(self.current_fps)
+        if fps_int != self._last_fps_int:
+            self._fps_surf = self._render_text(f"FPS: {fps_int}", 'small', YELLOW)
+            self._last_fps_int = fps_int
+        
+        self.screen.blit(self._fps_surf, (10, 10))
     
     def _draw_error_state(self, error_message: str) -> None:
         """Draw error state as fallback"""
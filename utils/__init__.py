@@ -6,6 +6,7 @@ This package contains utility functions and algorithms including:
 - Distance calculations
 - Obstacle detection
 - Direction utilities
+- Render math helpers (optionally Numba-compiled, ahead of time or JIT)
 
 Author: Devansh Tomar
 Version: 1.0.0
@@ -13,6 +14,7 @@ Version: 1.0.0
 
 from .pathfinding import (
     bfs_pathfind,
+    bfs_pathfind_bidir,
     a_star_pathfind,
     get_direction_to_target,
     calculate_distance,
@@ -25,10 +27,17 @@ from .pathfinding import (
     NoPathFoundError,
     InvalidPositionError
 )
+from .render_math import (
+    in_bounds_mask,
+    grid_to_pixels,
+    NUMBA_AVAILABLE,
+    NATIVE_AVAILABLE
+)
 
 __all__ = [
     # Pathfinding functions
     'bfs_pathfind',
+    'bfs_pathfind_bidir',
     'a_star_pathfind',
     'get_direction_to_target',
     
@@ -42,6 +51,12 @@ __all__ = [
     'is_position_valid',
     'find_safe_positions',
     
+    # Render math helpers
+    'in_bounds_mask',
+    'grid_to_pixels',
+    'NUMBA_AVAILABLE',
+    'NATIVE_AVAILABLE',
+    
     # Exceptions
     'PathfindingError',
     'NoPathFoundError',
@@ -0,0 +1,67 @@
+"""
+Ahead-of-Time Build for Native Kernels
+
+Compiles the render math and search kernels into the render_math_native
+and search_kernels_native extension modules next to this file, so the game
+starts without any JIT compilation. Requires Numba with numba.pycc; run
+once after installing or updating it:
+
+    python -m utils._aot_build
+    
+utils.render_math and utils.search_kernels pick the extensions up
+automatically and fall back to JIT or pure Python/NumPy versions when they
+are missing.
+
+Author: Devansh Tomar
+Version: 1.0.0
+"""
+
+import os
+import sys
+
+from utils.render_math import (
+    _in_bounds_mask_kernel,
+    _grid_to_pixels_kernel,
+    IN_BOUNDS_MASK_SIGNATURE,
+    GRID_TO_PIXELS_SIGNATURE
+)
+from utils.search_kernels import (
+    _bfs_kernel,
+    _a_star_kernel,
+    BFS_KERNEL_SIGNATURE,
+    A_STAR_KERNEL_SIGNATURE
+)
+
+
+def build() -> None:
+    """
+    Compile the kernels into utils/render_math_native and
+    utils/search_kernels_native.
+    
+    Raises:
+        ImportError: If Numba or numba.pycc is not available
+    """
+    from numba.pycc import CC
+    
+    output_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    cc = CC('render_math_native')
+    cc.output_dir = output_dir
+    cc.export('in_bounds_mask', IN_BOUNDS_MASK_SIGNATURE)(_in_bounds_mask_kernel)
+    cc.export('grid_to_pixels', GRID_TO_PIXELS_SIGNATURE)(_grid_to_pixels_kernel)
+    cc.compile()
+    
+    cc = CC('search_kernels_native')
+    cc.output_dir = output_dir
+    cc.export('bfs_kernel', BFS_KERNEL_SIGNATURE)(_bfs_kernel)
+    cc.export('a_star_kernel', A_STAR_KERNEL_SIGNATURE)(_a_star_kernel)
+    cc.compile()
+
+
+if __name__ == "__main__":
+    try:
+        build()
+    except ImportError as e:
+        print(f"Cannot build native kernels: {e}", file=sys.stderr)
+        sys.exit(1)
+    print("Built render_math_native and search_kernels_native")
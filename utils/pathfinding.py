@@ -12,6 +12,7 @@ Classes:
 
 Functions:
     bfs_pathfind: Breadth-first search pathfinding
+    bfs_pathfind_bidir: Bidirectional breadth-first search pathfinding
     a_star_pathfind: A* pathfinding algorithm
     get_all_obstacles: Get all obstacle positions
     get_valid_neighbors: Get valid neighboring positions
@@ -28,17 +29,39 @@ Version: 1.0.0
 import logging
 from collections import deque
 from typing import Tuple, List, Set, Optional, Dict
-from dataclasses import dataclass
 import heapq
 import math
 
+import numpy as np
+
 from enums import Direction
 from config import GRID_WIDTH, GRID_HEIGHT
 from models.snake import Snake
+from utils.search_kernels import KERNELS_AVAILABLE, bfs_kernel, a_star_kernel
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Neighbor offsets in Direction order, unpacked once instead of per expansion
+_DIRS = tuple(direction.value for direction in Direction)
+
+# Direction toward a target indexed by (sign(dx) + 1) * 3 + (sign(dy) + 1),
+# preferring horizontal moves; (0, 0) is rejected before the lookup
+_DIR_TABLE = (
+    Direction.LEFT, Direction.LEFT, Direction.LEFT,
+    Direction.UP, Direction.UP, Direction.DOWN,
+    Direction.RIGHT, Direction.RIGHT, Direction.RIGHT
+)
+
+# Recent obstacle bitmaps, newest first, as
+# (snake1 body, snake2 body, requester is snake1, bitmap)
+_BLOCKED_CACHE_SIZE = 4
+_blocked_cache: List[tuple] = []
+
+# Segment counts of the current board, shared by both snakes' bitmaps, as
+# (snake1 body, snake2 body, counts)
+_base_cache: Optional[tuple] = None
+
 
 # Custom Exceptions
 class PathfindingError(Exception):
@@ -56,20 +79,6 @@ class InvalidPositionError(PathfindingError):
     pass
 
 
-@dataclass
-class PathNode:
-    """Node for pathfinding algorithms"""
-    position: Tuple[int, int]
-    g_cost: float = 0  # Cost from start
-    h_cost: float = 0  # Heuristic cost to goal
-    f_cost: float = 0  # Total cost (g + h)
-    parent: Optional['PathNode'] = None
-    
-    def __lt__(self, other):
-        """For heap comparison"""
-        return self.f_cost < other.f_cost
-
-
 def validate_position(position: Tuple[int, int], name: str = "Position") -> None:
     """
     Validate that a position is valid.
@@ -138,23 +147,24 @@ def get_all_obstacles(snake1: Snake, snake2: Snake,
             raise PathfindingError("Requesting snake must be one of the game snakes")
         
         obstacles = set()
+        add = obstacles.add
         
-        # Add obstacles based on which snake is requesting
+        # The requesting snake's own body minus its tail, then all of the other
         if requesting_snake == snake1:
-            # For snake1: its own body (except tail) + all of snake2
-            if snake1.body and len(snake1.body) > 1:
-                obstacles.update(snake1.body[:-1])  # Exclude tail
-            if snake2.body:
-                obstacles.update(snake2.body)  # Include all of snake2
+            own_body, other_body = snake1.body, snake2.body
         else:
-            # For snake2: its own body (except tail) + all of snake1
-            if snake2.body and len(snake2.body) > 1:
-                obstacles.update(snake2.body[:-1])  # Exclude tail
-            if snake1.body:
-                obstacles.update(snake1.body)  # Include all of snake1
+            own_body, other_body = snake2.body, snake1.body
         
-        # Validate all obstacle positions
-        valid_obstacles = {pos for pos in obstacles if is_position_valid(pos)}
+        for i in range(len(own_body) - 1):  # Exclude tail
+            add(own_body[i])
+        obstacles.update(other_body)
+        
+        # Drop off-grid positions; snake bodies always hold int tuples, so a
+        # plain bounds check is enough here
+        width = GRID_WIDTH
+        height = GRID_HEIGHT
+        valid_obstacles = {pos for pos in obstacles
+                           if 0 <= pos[0] < width and 0 <= pos[1] < height}
         
         if len(valid_obstacles) != len(obstacles):
             logger.warning(f"Removed {len(obstacles) - len(valid_obstacles)} invalid obstacle positions")
@@ -191,34 +201,195 @@ def get_valid_neighbors(pos: Tuple[int, int], snake1: Snake, snake2: Snake,
         if not is_position_valid(pos):
             raise InvalidPositionError(f"Position {pos} is out of bounds")
         
-        x, y = pos
-        neighbors = []
-        obstacles = get_all_obstacles(snake1, snake2, requesting_snake)
-        
-        # Check all four directions
-        for direction in Direction:
-            dx, dy = direction.value
-            new_x, new_y = x + dx, y + dy
-            new_pos = (new_x, new_y)
-            
-            # Check if position is valid and not an obstacle
-            if is_position_valid(new_pos) and new_pos not in obstacles:
-                neighbors.append(new_pos)
-        
-        return neighbors
+        blocked = _build_blocked(snake1, snake2, requesting_snake)
+        return _neighbors(pos, blocked)
         
     except Exception as e:
         logger.error(f"Error getting valid neighbors: {e}")
         return []
 
 
+def _build_base_blocked(body1: List[Tuple[int, int]],
+                        body2: List[Tuple[int, int]]) -> bytearray:
+    """
+    Count the snake segments on each cell of the grid.
+    
+    Both snakes' obstacle bitmaps are this board with one tail removed, so
+    it is built once per pair of bodies and shared.
+    
+    Args:
+        body1: First snake's body
+        body2: Second snake's body
+        
+    Returns:
+        bytearray of GRID_WIDTH * GRID_HEIGHT segment counts; off-grid
+        segments are ignored. The result is shared; copy it before modifying
+    """
+    global _base_cache
+    
+    if _base_cache is not None and _base_cache[0] is body1 and _base_cache[1] is body2:
+        return _base_cache[2]
+    
+    width = GRID_WIDTH
+    height = GRID_HEIGHT
+    counts = bytearray(width * height)
+    for body in (body1, body2):
+        for x, y in body:
+            if 0 <= x < width and 0 <= y < height:
+                counts[y * width + x] += 1
+    
+    _base_cache = (body1, body2, counts)
+    return counts
+
+
+def _build_blocked(snake1: Snake, snake2: Snake, requesting_snake: Snake) -> bytearray:
+    """
+    Get the obstacles as a flat grid bitmap.
+    
+    Cell (x, y) is blocked[y * GRID_WIDTH + x], nonzero for an obstacle
+    and 0 otherwise; an index is cheaper to test than hashing a tuple. It
+    holds the same cells as get_all_obstacles(): the shared board from
+    _build_base_blocked() with the requesting snake's tail taken off.
+    
+    Several searches run per tick on the same board, so the last few
+    bitmaps are kept and reused while both snakes still return the same
+    body lists (Snake builds a new one after every move or reset). The
+    result may be shared; copy it before modifying.
+    
+    Args:
+        snake1: First snake in the game
+        snake2: Second snake in the game
+        requesting_snake: The snake requesting the pathfinding
+        
+    Returns:
+        bytearray of GRID_WIDTH * GRID_HEIGHT cells
+    """
+    width = GRID_WIDTH
+    requester_is_snake1 = requesting_snake is snake1
+    if not requester_is_snake1 and requesting_snake is not snake2:
+        # Not one of the game snakes; let get_all_obstacles() handle it
+        blocked = bytearray(width * GRID_HEIGHT)
+        for x, y in get_all_obstacles(snake1, snake2, requesting_snake):
+            blocked[y * width + x] = 1
+        return blocked
+    
+    body1 = snake1.body
+    body2 = snake2.body
+    for entry in _blocked_cache:
+        if entry[0] is body1 and entry[1] is body2 and entry[2] == requester_is_snake1:
+            return entry[3]
+    
+    # Free the requesting snake's tail cell unless another segment is on it
+    blocked = bytearray(_build_base_blocked(body1, body2))
+    own_body = body1 if requester_is_snake1 else body2
+    if own_body:
+        tail_x, tail_y = own_body[-1]
+        if 0 <= tail_x < width and 0 <= tail_y < GRID_HEIGHT:
+            blocked[tail_y * width + tail_x] -= 1
+    
+    # Holding the body lists keeps their identities from being reused
+    _blocked_cache.insert(0, (body1, body2, requester_is_snake1, blocked))
+    del _blocked_cache[_BLOCKED_CACHE_SIZE:]
+    return blocked
+
+
+def _unpack_cells(cells: np.ndarray) -> List[Tuple[int, int]]:
+    """
+    Convert packed y * GRID_WIDTH + x cells from a search kernel to positions.
+    
+    Args:
+        cells: Packed cells
+        
+    Returns:
+        List of (x, y) positions
+    """
+    width = GRID_WIDTH
+    return [(cell % width, cell // width) for cell in cells.tolist()]
+
+
+def _neighbors(pos: Tuple[int, int], blocked: bytearray) -> List[Tuple[int, int]]:
+    """
+    Get the in-bounds, unobstructed neighbors of a position.
+    
+    Unlike get_valid_neighbors() this does no validation and takes an
+    obstacle bitmap built once per search, so searches can call it for
+    every expanded node.
+    
+    Args:
+        pos: Current position
+        blocked: Obstacle bitmap from _build_blocked()
+        
+    Returns:
+        List of neighboring positions in Direction order
+    """
+    _GW = GRID_WIDTH
+    _GH = GRID_HEIGHT
+    x, y = pos
+    neighbors = []
+    
+    # Check all four directions
+    for dx, dy in _DIRS:
+        new_x, new_y = x + dx, y + dy
+        
+        if 0 <= new_x < _GW and 0 <= new_y < _GH and not blocked[new_y * _GW + new_x]:
+            neighbors.append((new_x, new_y))
+    
+    return neighbors
+
+
+def _line_path(start: Tuple[int, int], target: Tuple[int, int],
+               blocked: bytearray) -> Optional[List[Tuple[int, int]]]:
+    """
+    Walk a straight 4-connected line from start to target over the bitmap.
+    
+    Each step moves one cell along x or y, whichever keeps the walk closer
+    to the ideal line, so the path has exactly Manhattan length and is a
+    shortest path whenever it is clear.
+    
+    Args:
+        start: Starting position, not checked against the bitmap
+        target: Target position
+        blocked: Obstacle bitmap from _build_blocked()
+        
+    Returns:
+        List of positions from start (excluded) to target (included), or
+        None if any cell on the line is blocked
+    """
+    width = GRID_WIDTH
+    x, y = start
+    tx, ty = target
+    dx = abs(tx - x)
+    dy = abs(ty - y)
+    step_x = 1 if tx > x else -1
+    step_y = 1 if ty > y else -1
+    moved_x = moved_y = 0
+    path = []
+    
+    for _ in range(dx + dy):
+        # Step along x while its next cell center is nearer on the line
+        if (2 * moved_x + 1) * dy < (2 * moved_y + 1) * dx:
+            x += step_x
+            moved_x += 1
+        else:
+            y += step_y
+            moved_y += 1
+        
+        if blocked[y * width + x]:
+            return None
+        path.append((x, y))
+    
+    return path
+
+
 def bfs_pathfind(start: Tuple[int, int], target: Tuple[int, int],
                  snake1: Snake, snake2: Snake, requesting_snake: Snake,
                  max_depth: Optional[int] = None) -> List[Tuple[int, int]]:
     """
     Find shortest path using Breadth-First Search.
     
-    BFS guarantees the shortest path in terms of number of moves.
+    BFS guarantees the shortest path in terms of number of moves. When the
+    straight line to the target is clear, and no longer than max_depth if
+    that is given, it is returned without searching.
     
     Args:
         start: Starting position
@@ -251,37 +422,88 @@ def bfs_pathfind(start: Tuple[int, int], target: Tuple[int, int],
         if start == target:
             return []
         
-        # Initialize BFS
-        queue = deque([(start, [])])
-        visited = {start}
+        # Obstacles stay fixed for the whole search
+        blocked = _build_blocked(snake1, snake2, requesting_snake)
+        
+        # A target on an obstacle can never be entered, so skip the search
+        if blocked[target[1] * GRID_WIDTH + target[0]]:
+            logger.debug("BFS target %s is blocked", target)
+            return []
+        
+        # A clear straight line is already a shortest path
+        path = _line_path(start, target, blocked)
+        if path is not None and not (max_depth and len(path) > max_depth):
+            logger.debug("BFS found clear line of length %d", len(path))
+            return path
+        
+        # Cells are packed as y * width + x ints so the search never
+        # allocates or hashes position tuples
+        width = GRID_WIDTH
+        height = GRID_HEIGHT
+        start_idx = start[1] * width + start[0]
+        target_idx = target[1] * width + target[0]
+        
+        if KERNELS_AVAILABLE:
+            # Run the whole search in compiled code
+            cells, nodes_explored = bfs_kernel(
+                np.frombuffer(blocked, dtype=np.uint8), width, height,
+                start_idx, target_idx, max_depth or 0
+            )
+            path = _unpack_cells(cells)
+            if path:
+                logger.debug("BFS found path of length %d after exploring %d nodes", len(path), nodes_explored)
+            else:
+                logger.debug("BFS found no path from %s to %s after exploring %d nodes", start, target, nodes_explored)
+            return path
+        
+        # Initialize BFS; parent doubles as the visited set and is walked
+        # back once the target is found instead of copying paths per node
+        queue = deque([start_idx])
+        parent = [-1] * (width * height)
+        parent[start_idx] = start_idx
         nodes_explored = 0
         
         while queue:
             # Check depth limit
             if max_depth and nodes_explored >= max_depth:
-                logger.debug(f"BFS reached max depth {max_depth}")
+                logger.debug("BFS reached max depth %d", max_depth)
                 break
             
-            current_pos, path = queue.popleft()
+            current = queue.popleft()
             nodes_explored += 1
+            cx = current % width
+            cy = current // width
             
-            # Get valid neighbors
-            neighbors = get_valid_neighbors(current_pos, snake1, snake2, requesting_snake)
-            
-            for neighbor in neighbors:
+            for dx, dy in _DIRS:
+                nx = cx + dx
+                ny = cy + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                
+                neighbor = ny * width + nx
+                if blocked[neighbor]:
+                    continue
+                
                 # Check if we reached the target
-                if neighbor == target:
-                    final_path = path + [neighbor]
-                    logger.debug(f"BFS found path of length {len(final_path)} after exploring {nodes_explored} nodes")
+                if neighbor == target_idx:
+                    # Reconstruct path
+                    final_path = [target]
+                    node = current
+                    while node != start_idx:
+                        final_path.append((node % width, node // width))
+                        node = parent[node]
+                    final_path.reverse()
+                    
+                    logger.debug("BFS found path of length %d after exploring %d nodes", len(final_path), nodes_explored)
                     return final_path
                 
                 # Add unvisited neighbors to queue
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append((neighbor, path + [neighbor]))
+                if parent[neighbor] == -1:
+                    parent[neighbor] = current
+                    queue.append(neighbor)
         
         # No path found
-        logger.debug(f"BFS found no path from {start} to {target} after exploring {nodes_explored} nodes")
+        logger.debug("BFS found no path from %s to %s after exploring %d nodes", start, target, nodes_explored)
         return []
         
     except InvalidPositionError:
@@ -291,6 +513,142 @@ def bfs_pathfind(start: Tuple[int, int], target: Tuple[int, int],
         raise PathfindingError(f"BFS pathfinding failed: {e}")
 
 
+def bfs_pathfind_bidir(start: Tuple[int, int], target: Tuple[int, int],
+                       snake1: Snake, snake2: Snake, requesting_snake: Snake,
+                       max_depth: Optional[int] = None) -> List[Tuple[int, int]]:
+    """
+    Find shortest path using BFS from both ends at once.
+    
+    Whole layers are expanded alternately from the start and the target,
+    always from the side with the smaller frontier, until they meet. This
+    explores far fewer nodes than bfs_pathfind() on long paths and also
+    returns a shortest path, though not necessarily the same one.
+    
+    Args:
+        start: Starting position
+        target: Target position
+        snake1: First snake
+        snake2: Second snake
+        requesting_snake: Snake requesting the path
+        max_depth: Optional maximum number of nodes to expand
+        
+    Returns:
+        List of positions representing the path (excluding start)
+        Empty list if no path found
+        
+    Raises:
+        InvalidPositionError: If positions are invalid
+        PathfindingError: If other errors occur
+    """
+    try:
+        # Validate positions
+        validate_position(start, "Start position")
+        validate_position(target, "Target position")
+        
+        if not is_position_valid(start):
+            raise InvalidPositionError(f"Start position {start} is out of bounds")
+        
+        if not is_position_valid(target):
+            raise InvalidPositionError(f"Target position {target} is out of bounds")
+        
+        # Early exit if start equals target
+        if start == target:
+            return []
+        
+        # Obstacles stay fixed for the whole search. The start is usually the
+        # snake's own head; clear it in a copy so the backward search can
+        # arrive there
+        blocked = bytearray(_build_blocked(snake1, snake2, requesting_snake))
+        if blocked[target[1] * GRID_WIDTH + target[0]]:
+            return []
+        blocked[start[1] * GRID_WIDTH + start[0]] = 0
+        
+        # Per side: parent links, distances from that side's root, frontier
+        parent_f: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start: None}
+        parent_b: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {target: None}
+        dist_f = {start: 0}
+        dist_b = {target: 0}
+        frontier_f = [start]
+        frontier_b = [target]
+        nodes_explored = 0
+        
+        while frontier_f and frontier_b:
+            forward = len(frontier_f) <= len(frontier_b)
+            if forward:
+                frontier, parents, dists, other_dists = frontier_f, parent_f, dist_f, dist_b
+            else:
+                frontier, parents, dists, other_dists = frontier_b, parent_b, dist_b, dist_f
+            
+            # Expand one whole layer, keeping the shortest meeting found in it
+            next_frontier = []
+            meeting = None
+            meeting_length = 0
+            for current_pos in frontier:
+                # Check depth limit
+                if max_depth and nodes_explored >= max_depth:
+                    logger.debug("Bidirectional BFS reached max depth %d", max_depth)
+                    return []
+                nodes_explored += 1
+                
+                for neighbor in _neighbors(current_pos, blocked):
+                    if neighbor in other_dists:
+                        length = dists[current_pos] + 1 + other_dists[neighbor]
+                        if meeting is None or length < meeting_length:
+                            meeting = (current_pos, neighbor)
+                            meeting_length = length
+                    
+                    if neighbor not in parents:
+                        parents[neighbor] = current_pos
+                        dists[neighbor] = dists[current_pos] + 1
+                        next_frontier.append(neighbor)
+            
+            if meeting is not None:
+                # Orient the meeting edge as (forward side, backward side)
+                node_f, node_b = meeting if forward else (meeting[1], meeting[0])
+                
+                # Start side: walk back to the start, then reverse
+                path = []
+                node = node_f
+                while node != start:
+                    path.append(node)
+                    node = parent_f[node]
+                path.reverse()
+                
+                # Target side: walk forward to the target
+                node = node_b
+                while node is not None:
+                    path.append(node)
+                    node = parent_b[node]
+                
+                logger.debug("Bidirectional BFS found path of length %d after exploring %d nodes", len(path), nodes_explored)
+                return path
+            
+            if forward:
+                frontier_f = next_frontier
+            else:
+                frontier_b = next_frontier
+        
+        # No path found
+        logger.debug("Bidirectional BFS found no path from %s to %s after exploring %d nodes", start, target, nodes_explored)
+        return []
+        
+    except InvalidPositionError:
+        raise
+    except Exception as e:
+        logger.error(f"Error in bidirectional BFS pathfinding: {e}")
+        raise PathfindingError(f"Bidirectional BFS pathfinding failed: {e}")
+
+
+def _manhattan(x1: int, y1: int, x2: int, y2: int) -> int:
+    """Manhattan distance between (x1, y1) and (x2, y2), without validation"""
+    return abs(x1 - x2) + abs(y1 - y2)
+
+
+def _dist_sq(dx: int, dy: int) -> int:
+    """Squared Euclidean length of (dx, dy), for comparing distances without sqrt"""
+    return dx * dx + dy * dy
+
+
 def calculate_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
     """
     Calculate Manhattan distance between two positions.
@@ -312,7 +670,7 @@ def calculate_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
         validate_position(pos1, "Position 1")
         validate_position(pos2, "Position 2")
         
-        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
+        return _manhattan(pos1[0], pos1[1], pos2[0], pos2[1])
         
     except InvalidPositionError:
         raise
@@ -339,9 +697,7 @@ def calculate_euclidean_distance(pos1: Tuple[int, int], pos2: Tuple[int, int]) -
         validate_position(pos1, "Position 1")
         validate_position(pos2, "Position 2")
         
-        dx = pos1[0] - pos2[0]
-        dy = pos1[1] - pos2[1]
-        return math.sqrt(dx * dx + dy * dy)
+        return math.sqrt(_dist_sq(pos1[0] - pos2[0], pos1[1] - pos2[1]))
         
     except InvalidPositionError:
         raise
@@ -375,21 +731,11 @@ def get_direction_to_target(current_pos: Tuple[int, int],
         if current_pos == target_pos:
             raise PathfindingError("Current and target positions are the same")
         
-        curr_x, curr_y = current_pos
-        target_x, target_y = target_pos
-        
-        dx = target_x - curr_x
-        dy = target_y - curr_y
+        dx = target_pos[0] - current_pos[0]
+        dy = target_pos[1] - current_pos[1]
         
         # Prioritize horizontal movement for diagonal positions
-        if dx > 0:
-            return Direction.RIGHT
-        elif dx < 0:
-            return Direction.LEFT
-        elif dy > 0:
-            return Direction.DOWN
-        else:
-            return Direction.UP
+        return _DIR_TABLE[((dx > 0) - (dx < 0) + 1) * 3 + (dy > 0) - (dy < 0) + 1]
             
     except (InvalidPositionError, PathfindingError):
         raise
@@ -427,62 +773,101 @@ def a_star_pathfind(start: Tuple[int, int], target: Tuple[int, int],
         if start == target:
             return []
         
-        # Initialize A*
-        start_node = PathNode(start, 0, calculate_distance(start, target))
-        start_node.f_cost = start_node.g_cost + start_node.h_cost
+        # Nothing can be expanded from outside the grid
+        if not is_position_valid(start):
+            return []
+        
+        # A target off the grid or on an obstacle can never be reached, so
+        # skip the search. The start is usually the snake's own head and so
+        # always an obstacle; it is never checked
+        if not is_position_valid(target):
+            return []
         
-        open_set = [start_node]
-        closed_set: Set[Tuple[int, int]] = set()
-        node_map: Dict[Tuple[int, int], PathNode] = {start: start_node}
+        # Obstacles stay fixed for the whole search
+        blocked = _build_blocked(snake1, snake2, requesting_snake)
+        if blocked[target[1] * GRID_WIDTH + target[0]]:
+            logger.debug("A* target %s is blocked", target)
+            return []
+        
+        if KERNELS_AVAILABLE:
+            # Run the whole search in compiled code
+            cells, nodes_explored = a_star_kernel(
+                np.frombuffer(blocked, dtype=np.uint8), GRID_WIDTH, GRID_HEIGHT,
+                start[0], start[1], target[0], target[1], max_nodes
+            )
+            path = _unpack_cells(cells)
+            if path:
+                logger.debug("A* found path of length %d after exploring %d nodes", len(path), nodes_explored)
+            else:
+                logger.debug("A* found no path after exploring %d nodes", nodes_explored)
+            return path
+        
+        # Initialize A*; per-cell costs live in flat arrays indexed by
+        # y * width + x, and the heap holds (priority, cell) int pairs
+        width = GRID_WIDTH
+        height = GRID_HEIGHT
+        size = width * height
+        sx, sy = start
+        tx, ty = target
+        start_idx = sy * width + sx
+        target_idx = ty * width + tx
+        
+        g_cost = [0] * size
+        parent = [-1] * size
+        state = bytearray(size)  # 0 unseen, 1 open, 2 closed
+        
+        # Priority is f * size - g: lowest f first, deeper nodes on ties
+        state[start_idx] = 1
+        open_set = [((abs(sx - tx) + abs(sy - ty)) * size, start_idx)]
         nodes_explored = 0
         
         while open_set and nodes_explored < max_nodes:
-            # Get node with lowest f_cost
-            current_node = heapq.heappop(open_set)
+            # Get cell with lowest priority. Entries are never updated in
+            # place; one whose g (recovered from its priority) is no longer
+            # the cell's best was superseded by a cheaper path, so skip it
+            priority, current = heapq.heappop(open_set)
+            if (size - priority % size) % size != g_cost[current]:
+                continue
             nodes_explored += 1
             
             # Check if we reached the target
-            if current_node.position == target:
+            if current == target_idx:
                 # Reconstruct path
                 path = []
-                node = current_node
-                while node.parent:
-                    path.append(node.position)
-                    node = node.parent
+                while current != start_idx:
+                    path.append((current % width, current // width))
+                    current = parent[current]
                 path.reverse()
                 
-                logger.debug(f"A* found path of length {len(path)} after exploring {nodes_explored} nodes")
+                logger.debug("A* found path of length %d after exploring %d nodes", len(path), nodes_explored)
                 return path
             
-            closed_set.add(current_node.position)
+            state[current] = 2
+            cx = current % width
+            cy = current // width
+            g = g_cost[current] + 1
             
             # Explore neighbors
-            neighbors = get_valid_neighbors(current_node.position, snake1, snake2, requesting_snake)
-            
-            for neighbor_pos in neighbors:
-                if neighbor_pos in closed_set:
+            for dx, dy in _DIRS:
+                nx = cx + dx
+                ny = cy + dy
+                if not (0 <= nx < width and 0 <= ny < height):
                     continue
                 
-                # Calculate costs
-                g_cost = current_node.g_cost + 1
-                h_cost = calculate_distance(neighbor_pos, target)
-                f_cost = g_cost + h_cost
+                neighbor = ny * width + nx
+                if blocked[neighbor] or state[neighbor] == 2:
+                    continue
                 
-                # Check if we have a better path to this neighbor
-                if neighbor_pos in node_map:
-                    neighbor_node = node_map[neighbor_pos]
-                    if g_cost < neighbor_node.g_cost:
-                        neighbor_node.g_cost = g_cost
-                        neighbor_node.f_cost = f_cost
-                        neighbor_node.parent = current_node
-                else:
-                    # Create new node
-                    neighbor_node = PathNode(neighbor_pos, g_cost, h_cost, f_cost, current_node)
-                    node_map[neighbor_pos] = neighbor_node
-                    heapq.heappush(open_set, neighbor_node)
+                # Queue the neighbor if it is new or now reachable more cheaply
+                if state[neighbor] == 0 or g < g_cost[neighbor]:
+                    state[neighbor] = 1
+                    g_cost[neighbor] = g
+                    parent[neighbor] = current
+                    f = g + abs(nx - tx) + abs(ny - ty)
+                    heapq.heappush(open_set, (f * size - g, neighbor))
         
         # No path found
-        logger.debug(f"A* found no path after exploring {nodes_explored} nodes")
+        logger.debug("A* found no path after exploring %d nodes", nodes_explored)
         return []
         
     except Exception as e:
@@ -510,25 +895,35 @@ def find_safe_positions(snake1: Snake, snake2: Snake, requesting_snake: Snake,
         if not requesting_snake or not requesting_snake.body:
             return []
         
-        head = requesting_snake.get_head()
-        obstacles = get_all_obstacles(snake1, snake2, requesting_snake)
-        safe_positions = []
-        
-        # Search within radius
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                if abs(dx) + abs(dy) > radius:  # Manhattan distance check
-                    continue
-                
-                pos = (head[0] + dx, head[1] + dy)
-                
-                if is_position_valid(pos) and pos not in obstacles and pos != head:
-                    safe_positions.append(pos)
-        
-        # Sort by distance from head
-        safe_positions.sort(key=lambda pos: calculate_distance(head, pos))
-        
-        return safe_positions
+        head_x, head_y = requesting_snake.get_head()
+        width = GRID_WIDTH
+        height = GRID_HEIGHT
+        blocked = np.frombuffer(_build_blocked(snake1, snake2, requesting_snake), dtype=np.uint8)
+        
+        # Offsets within the Manhattan radius, excluding the head itself;
+        # 'ij' indexing keeps them in dx-major order
+        offsets = np.arange(-radius, radius + 1)
+        dx, dy = np.meshgrid(offsets, offsets, indexing='ij')
+        distances = np.abs(dx) + np.abs(dy)
+        in_radius = (distances <= radius) & (distances > 0)
+        dx = dx[in_radius]
+        dy = dy[in_radius]
+        distances = distances[in_radius]
+        
+        # Keep on-grid, unobstructed positions
+        xs = head_x + dx
+        ys = head_y + dy
+        on_grid = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+        xs = xs[on_grid]
+        ys = ys[on_grid]
+        distances = distances[on_grid]
+        free = blocked[ys * width + xs] == 0
+        xs = xs[free]
+        ys = ys[free]
+        
+        # Sort by distance from head, keeping scan order on ties
+        order = np.argsort(distances[free], kind='stable')
+        return list(zip(xs[order].tolist(), ys[order].tolist()))
         
     except Exception as e:
         logger.error(f"Error finding safe positions: {e}")
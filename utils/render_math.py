@@ -0,0 +1,115 @@
+"""
+Render Math Module
+
+This module provides the per-frame numeric helpers used by the renderer:
+bounds masks for snake segments and grid-to-pixel conversion.
+
+The helpers come from the first available backend:
+1. render_math_native, an extension module compiled ahead of time by
+   utils/_aot_build.py, so there is no compilation at import or first call
+2. Numba, compiling the loop kernels at import with explicit signatures
+   and caching them on disk
+3. Equivalent NumPy implementations
+
+Functions:
+    in_bounds_mask: Mask of grid positions that lie inside the grid
+    grid_to_pixels: Convert grid coordinates to top-left pixel coordinates
+    
+Author: Devansh Tomar
+Version: 1.0.0
+"""
+
+import logging
+from typing import Tuple
+
+import numpy as np
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+
+try:
+    from . import render_math_native
+    NATIVE_AVAILABLE = True
+except ImportError:
+    NATIVE_AVAILABLE = False
+
+# Signatures shared by the JIT and ahead-of-time builds
+IN_BOUNDS_MASK_SIGNATURE = "boolean[:](int16[:], int16[:], int32, int32)"
+GRID_TO_PIXELS_SIGNATURE = "UniTuple(int32[:], 2)(int16[:], int16[:], int32, int32)"
+
+
+def _in_bounds_mask_kernel(xs, ys, grid_width, grid_height):
+    """Loop form of in_bounds_mask() for Numba to compile"""
+    mask = np.empty(xs.shape[0], dtype=np.bool_)
+    for i in range(xs.shape[0]):
+        x = xs[i]
+        y = ys[i]
+        mask[i] = 0 <= x < grid_width and 0 <= y < grid_height
+    return mask
+
+
+def _grid_to_pixels_kernel(xs, ys, grid_size, y_offset):
+    """Loop form of grid_to_pixels() for Numba to compile"""
+    count = xs.shape[0]
+    pixel_xs = np.empty(count, dtype=np.int32)
+    pixel_ys = np.empty(count, dtype=np.int32)
+    for i in range(count):
+        pixel_xs[i] = xs[i] * grid_size
+        pixel_ys[i] = ys[i] * grid_size + y_offset
+    return pixel_xs, pixel_ys
+
+
+def _in_bounds_mask_numpy(xs: np.ndarray, ys: np.ndarray,
+                          grid_width: int, grid_height: int) -> np.ndarray:
+    """
+    Mark the positions that lie inside the grid.
+    
+    Args:
+        xs: X coordinates
+        ys: Y coordinates
+        grid_width: Number of columns
+        grid_height: Number of rows
+        
+    Returns:
+        Boolean array, True where (x, y) is on the grid
+    """
+    return (xs >= 0) & (xs < grid_width) & (ys >= 0) & (ys < grid_height)
+
+
+def _grid_to_pixels_numpy(xs: np.ndarray, ys: np.ndarray,
+                          grid_size: int, y_offset: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert grid coordinates to the top-left pixel of each cell.
+    
+    Args:
+        xs: X coordinates
+        ys: Y coordinates
+        grid_size: Cell size in pixels
+        y_offset: Pixel offset of the playing field from the top
+        
+    Returns:
+        Tuple of (pixel_xs, pixel_ys) int32 arrays
+    """
+    pixel_xs = xs.astype(np.int32)
+    pixel_xs *= grid_size
+    pixel_ys = ys.astype(np.int32)
+    pixel_ys *= grid_size
+    pixel_ys += y_offset
+    return pixel_xs, pixel_ys
+
+
+if NATIVE_AVAILABLE:
+    in_bounds_mask = render_math_native.in_bounds_mask
+    grid_to_pixels = render_math_native.grid_to_pixels
+elif NUMBA_AVAILABLE:
+    in_bounds_mask = njit(IN_BOUNDS_MASK_SIGNATURE, cache=True)(_in_bounds_mask_kernel)
+    grid_to_pixels = njit(GRID_TO_PIXELS_SIGNATURE, cache=True, fastmath=True)(_grid_to_pixels_kernel)
+else:
+    in_bounds_mask = _in_bounds_mask_numpy
+    grid_to_pixels = _grid_to_pixels_numpy
@@ -0,0 +1,289 @@
+"""
+Search Kernels Module
+
+This module provides array-based BFS and A* search loops for the grid.
+utils.pathfinding validates inputs, builds the obstacle bitmap and calls
+these kernels when KERNELS_AVAILABLE is set, otherwise it runs its own
+pure-Python loops.
+
+The kernels come from the first available backend:
+1. search_kernels_native, an extension module compiled ahead of time by
+   utils/_aot_build.py, so there is no JIT warmup and Numba is not needed
+   at runtime
+2. Numba, compiling the loops on first call and caching them on disk
+
+Cells are packed as y * width + x. Both kernels expand neighbors in
+Direction order, and the A* heap follows heapq's algorithm on the same
+(priority, cell) entries, so they return the same paths as the Python loops.
+
+Functions:
+    bfs_kernel: Breadth-first search over a packed obstacle bitmap
+    a_star_kernel: A* search over a packed obstacle bitmap
+    
+Author: Devansh Tomar
+Version: 1.0.0
+"""
+
+import logging
+
+import numpy as np
+
+from enums import Direction
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    NUMBA_AVAILABLE = False
+
+try:
+    from . import search_kernels_native
+    NATIVE_AVAILABLE = True
+except ImportError:
+    NATIVE_AVAILABLE = False
+
+KERNELS_AVAILABLE = NATIVE_AVAILABLE or NUMBA_AVAILABLE
+
+# Signatures for the ahead-of-time build
+BFS_KERNEL_SIGNATURE = "Tuple((int32[:], int64))(uint8[:], int64, int64, int64, int64, int64)"
+A_STAR_KERNEL_SIGNATURE = (
+    "Tuple((int32[:], int64))(uint8[:], int64, int64, int64, int64, int64, int64, int64)"
+)
+
+# Neighbor offsets in Direction order
+_DX = np.array([direction.value[0] for direction in Direction], dtype=np.int64)
+_DY = np.array([direction.value[1] for direction in Direction], dtype=np.int64)
+
+
+def _bfs_kernel(blocked, width, height, start, target, max_nodes):
+    """
+    Breadth-first search from start to target.
+    
+    Args:
+        blocked: Flat uint8 obstacle bitmap, nonzero for obstacles
+        width: Grid width
+        height: Grid height
+        start: Packed start cell
+        target: Packed target cell, different from start
+        max_nodes: Maximum nodes to expand, 0 for no limit
+        
+    Returns:
+        Tuple of (packed path cells excluding start, nodes explored); the
+        path is empty if none was found
+    """
+    size = width * height
+    parent = np.full(size, -1, dtype=np.int32)
+    queue = np.empty(size, dtype=np.int32)
+    
+    queue[0] = start
+    head = 0
+    tail = 1
+    parent[start] = start
+    nodes_explored = 0
+    
+    while head < tail:
+        if max_nodes > 0 and nodes_explored >= max_nodes:
+            break
+        
+        current = queue[head]
+        head += 1
+        nodes_explored += 1
+        cx = current % width
+        cy = current // width
+        
+        for d in range(4):
+            nx = cx + _DX[d]
+            ny = cy + _DY[d]
+            if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                continue
+            
+            neighbor = ny * width + nx
+            if blocked[neighbor]:
+                continue
+            
+            if neighbor == target:
+                # Count the path, then fill it in from the target backwards
+                length = 1
+                node = current
+                while node != start:
+                    length += 1
+                    node = parent[node]
+                
+                path = np.empty(length, dtype=np.int32)
+                path[length - 1] = neighbor
+                node = current
+                i = length - 2
+                while node != start:
+                    path[i] = node
+                    node = parent[node]
+                    i -= 1
+                return path, nodes_explored
+            
+            if parent[neighbor] == -1:
+                parent[neighbor] = current
+                queue[tail] = neighbor
+                tail += 1
+    
+    return np.empty(0, dtype=np.int32), nodes_explored
+
+
+def _entry_less(keys, cells, a, b):
+    """Whether heap entry a sorts before entry b, comparing (key, cell)"""
+    return keys[a] < keys[b] or (keys[a] == keys[b] and cells[a] < cells[b])
+
+
+def _heap_push(keys, cells, length, key, cell):
+    """Push (key, cell) onto a heap of the first length entries, as heapq.heappush does"""
+    pos = length
+    keys[pos] = key
+    cells[pos] = cell
+    _sift_down(keys, cells, 0, pos)
+    return length + 1
+
+
+def _sift_down(keys, cells, start_pos, pos):
+    """Move entry pos towards the root, as heapq._siftdown does"""
+    key = keys[pos]
+    cell = cells[pos]
+    while pos > start_pos:
+        parent_pos = (pos - 1) >> 1
+        if key < keys[parent_pos] or (key == keys[parent_pos] and cell < cells[parent_pos]):
+            keys[pos] = keys[parent_pos]
+            cells[pos] = cells[parent_pos]
+            pos = parent_pos
+            continue
+        break
+    keys[pos] = key
+    cells[pos] = cell
+
+
+def _sift_up(keys, cells, end_pos, pos):
+    """Move entry pos towards the leaves, as heapq._siftup does"""
+    start_pos = pos
+    key = keys[pos]
+    cell = cells[pos]
+    child_pos = 2 * pos + 1
+    while child_pos < end_pos:
+        right_pos = child_pos + 1
+        if right_pos < end_pos and not _entry_less(keys, cells, child_pos, right_pos):
+            child_pos = right_pos
+        keys[pos] = keys[child_pos]
+        cells[pos] = cells[child_pos]
+        pos = child_pos
+        child_pos = 2 * pos + 1
+    keys[pos] = key
+    cells[pos] = cell
+    _sift_down(keys, cells, start_pos, pos)
+
+
+def _a_star_kernel(blocked, width, height, sx, sy, tx, ty, max_nodes):
+    """
+    A* search with a Manhattan heuristic from (sx, sy) to (tx, ty).
+    
+    The heap holds (f * size - g, cell) entries in two parallel arrays, so
+    ties on f go to the deeper node; entries whose g no longer matches the
+    cell's best cost were superseded and are skipped when popped.
+    
+    Args:
+        blocked: Flat uint8 obstacle bitmap, nonzero for obstacles
+        width: Grid width
+        height: Grid height
+        sx: Start x, inside the grid
+        sy: Start y, inside the grid
+        tx: Target x, may lie outside the grid
+        ty: Target y, may lie outside the grid
+        max_nodes: Maximum nodes to expand
+        
+    Returns:
+        Tuple of (packed path cells excluding start, nodes explored); the
+        path is empty if none was found
+    """
+    size = width * height
+    start = sy * width + sx
+    target = ty * width + tx if 0 <= tx < width and 0 <= ty < height else -1
+    
+    g_cost = np.zeros(size, dtype=np.int64)
+    parent = np.full(size, -1, dtype=np.int32)
+    state = np.zeros(size, dtype=np.int8)  # 0 unseen, 1 open, 2 closed
+    
+    # Every cell is pushed at most once per incoming edge
+    heap_keys = np.empty(4 * size + 1, dtype=np.int64)
+    heap_cells = np.empty(4 * size + 1, dtype=np.int32)
+    
+    state[start] = 1
+    heap_len = _heap_push(heap_keys, heap_cells, 0, (abs(sx - tx) + abs(sy - ty)) * size, start)
+    nodes_explored = 0
+    
+    while heap_len > 0 and nodes_explored < max_nodes:
+        # Pop the entry with the lowest priority
+        heap_len -= 1
+        priority = heap_keys[0]
+        current = heap_cells[0]
+        heap_keys[0] = heap_keys[heap_len]
+        heap_cells[0] = heap_cells[heap_len]
+        if heap_len > 0:
+            _sift_up(heap_keys, heap_cells, heap_len, 0)
+        
+        if (size - priority % size) % size != g_cost[current]:
+            continue
+        nodes_explored += 1
+        
+        if current == target:
+            # Count the path, then fill it in from the target backwards
+            length = 0
+            node = current
+            while node != start:
+                length += 1
+                node = parent[node]
+            
+            path = np.empty(length, dtype=np.int32)
+            node = current
+            for i in range(length - 1, -1, -1):
+                path[i] = node
+                node = parent[node]
+            return path, nodes_explored
+        
+        state[current] = 2
+        cx = current % width
+        cy = current // width
+        g = g_cost[current] + 1
+        
+        for d in range(4):
+            nx = cx + _DX[d]
+            ny = cy + _DY[d]
+            if nx < 0 or nx >= width or ny < 0 or ny >= height:
+                continue
+            
+            neighbor = ny * width + nx
+            if blocked[neighbor] or state[neighbor] == 2:
+                continue
+            
+            if state[neighbor] == 0 or g < g_cost[neighbor]:
+                state[neighbor] = 1
+                g_cost[neighbor] = g
+                parent[neighbor] = current
+                f = g + abs(nx - tx) + abs(ny - ty)
+                heap_len = _heap_push(heap_keys, heap_cells, heap_len, f * size - g, neighbor)
+    
+    return np.empty(0, dtype=np.int32), nodes_explored
+
+
+if NUMBA_AVAILABLE:
+    # The heap helpers are compiled for the JIT and ahead-of-time builds alike
+    _entry_less = njit(cache=True)(_entry_less)
+    _sift_down = njit(cache=True)(_sift_down)
+    _sift_up = njit(cache=True)(_sift_up)
+    _heap_push = njit(cache=True)(_heap_push)
+
+if NATIVE_AVAILABLE:
+    bfs_kernel = search_kernels_native.bfs_kernel
+    a_star_kernel = search_kernels_native.a_star_kernel
+elif NUMBA_AVAILABLE:
+    bfs_kernel = njit(cache=True)(_bfs_kernel)
+    a_star_kernel = njit(cache=True)(_a_star_kernel)
+else:
+    bfs_kernel = None
+    a_star_kernel = None